@@ -24,24 +24,24 @@ def main(argv):
     node_names = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
     current_node_name_index = 0
 
+    # Graph node names for each BSP node, keyed by the id of the node. Post-order traversal visits both children of a
+    # node before the node itself, so the children's names are always here by the time they're needed.
+    viz_names = {}
+
     print('digraph {')
 
     for node in bsp.post_order():
-        try:
-            node_name = getattr(node, 'viz_name')
-        except AttributeError:
-            node_name = node_names[current_node_name_index]
-            setattr(node, 'viz_name', node_name)
+        node_name = node_names[current_node_name_index]
+        viz_names[id(node)] = node_name
 
-            bounds = (node.x, node.y, node.width, node.height)
-            print(f'  {node_name} [label=\"{current_node_name_index}: {bounds}\"]')
+        bounds = (node.x, node.y, node.width, node.height)
+        print(f'  {node_name} [label=\"{current_node_name_index}: {bounds}\"]')
 
-            current_node_name_index += 1
+        current_node_name_index += 1
 
         if node.children:
-            node_name = getattr(node, 'viz_name')
-            left_child_name = getattr(node.children[0], 'viz_name')
-            right_child_name = getattr(node.children[1], 'viz_name')
+            left_child_name = viz_names[id(node.children[0])]
+            right_child_name = viz_names[id(node.children[1])]
             print(f'  {node_name} -> {left_child_name}')
             print(f'  {node_name} -> {right_child_name}')
 
@@ -20,6 +20,7 @@ def parse_args(argv, *a, **kw):
     parser.add_argument('--debug', action='store_true', default=True)
     parser.add_argument('--font')
     parser.add_argument('--sandbox', action='store_true', default=False)
+    parser.add_argument('--seed', type=int, help='Seed the random number generators, to replay the same game')
     args = parser.parse_args(argv)
     return args
 
@@ -50,7 +51,8 @@ def main(argv):
     configuration = Configuration(
         console_font_configuration=font_config,
         map_size=Size(80, 40),
-        sandbox=args.sandbox)
+        sandbox=args.sandbox,
+        seed=args.seed)
 
     engine = Engine(configuration)
     interface = Interface(configuration.console_size, engine)
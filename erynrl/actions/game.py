@@ -56,16 +56,12 @@ class BumpAction(MoveAction):
     def perform(self, engine: 'Engine') -> ActionResult:
         new_position = self.actor.position + self.direction
 
+        # Check the cheap conditions first. A bump into a wall or off the edge of the map fails no matter who's
+        # standing there, so only look for an entity if the tile can be entered.
         position_is_in_bounds = engine.map.point_is_in_bounds(new_position)
-        position_is_walkable = engine.map.point_is_walkable(new_position)
+        position_is_walkable = position_is_in_bounds and engine.map.point_is_walkable(new_position)
 
-        for ent in engine.entities:
-            if new_position != ent.position or not ent.blocks_movement:
-                continue
-            entity_occupying_position = ent
-            break
-        else:
-            entity_occupying_position = None
+        entity_occupying_position = engine.blocking_entity_at(new_position) if position_is_walkable else None
 
         log.ACTIONS.info(
             'Bumping %s into %s (in_bounds:%s walkable:%s overlaps:%s)',
@@ -98,7 +94,7 @@ class WalkAction(MoveAction):
         new_position = actor.position + self.direction
 
         log.ACTIONS.debug('Moving %s to %s', self.actor, new_position)
-        actor.position = new_position
+        engine.move_entity(actor, new_position)
 
         try:
             should_recover_hit_points = actor.fighter.passively_recover_hit_points(5)
@@ -193,7 +189,7 @@ class DropItemAction(Action):
         self.item = item
 
     def perform(self, engine: 'Engine') -> ActionResult:
-        engine.entities.add(self.item)
+        engine.add_entity(self.item)
         return self.success()
 
 
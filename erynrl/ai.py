@@ -1,7 +1,7 @@
 # Eryn Wells <eryn@erynwells.me>
 
 import random
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import numpy as np
 import tcod
@@ -10,7 +10,7 @@ from . import log
 from .actions.action import Action
 from .actions.game import BumpAction, WaitAction
 from .components import Component
-from .geometry import Direction, Point
+from .geometry import Direction, Point, Vector
 from .object import Entity
 
 if TYPE_CHECKING:
@@ -38,63 +38,128 @@ class HostileEnemy(AI):
     beeline for her.
     '''
 
+    def __init__(self, entity: Entity) -> None:
+        super().__init__(entity)
+
+        # The most recently computed field of view, and the position it was computed from: a tuple of (position, x, y,
+        # visible), where `visible` covers a window of the map whose top left corner is at (x, y). The map doesn't
+        # change, so as long as the entity stays put, its field of view doesn't either.
+        self.__field_of_view: Optional[Tuple[Tuple[int, int], int, int, np.ndarray]] = None
+
     def act(self, engine: 'Engine') -> Optional[Action]:
-        visible_tiles = tcod.map.compute_fov(
-            engine.map.tiles['transparent'],
-            pov=tuple(self.entity.position),
-            radius=self.entity.sight_radius)
+        entity = self.entity
+        entity_position = entity.position
+
+        # The entity doesn't move while it's deciding what to do, so look up whether the player can see it once.
+        # Logging is limited to entities the player can see.
+        should_log = engine.map.visible[entity_position.numpy_index]
 
-        if engine.map.visible[tuple(self.entity.position)]:
-            log.AI.debug("AI for %s", self.entity)
+        if should_log:
+            log.AI.debug("AI for %s", entity)
 
         hero_position = engine.hero.position
-        hero_is_visible = visible_tiles[hero_position.x, hero_position.y]
+        hero_is_visible = self._can_see_hero(engine)
 
         if hero_is_visible:
             path_to_hero = self.get_path_to(hero_position, engine)
-            assert len(path_to_hero) > 0, f'{self.entity} attempting to find a path to hero while on top of the hero!'
+            assert len(path_to_hero) > 0, f'{entity} attempting to find a path to hero while on top of the hero!'
 
-            entity_position = self.entity.position
-
-            if engine.map.visible[tuple(self.entity.position)]:
+            if should_log:
                 log.AI.debug('|-> Path to hero %s', path_to_hero)
 
             next_position = path_to_hero.pop(0) if len(path_to_hero) > 1 else hero_position
             direction_to_next_position = entity_position.direction_to_adjacent_point(next_position)
 
-            if engine.map.visible[tuple(self.entity.position)]:
+            if should_log:
                 log.AI.info('`-> Hero is visible to %s, bumping %s (%s)',
-                            self.entity, direction_to_next_position, next_position)
+                            entity, direction_to_next_position, next_position)
 
-            return BumpAction(self.entity, direction_to_next_position)
+            return BumpAction(entity, direction_to_next_position)
         else:
             move_or_wait_chance = random.random()
             if move_or_wait_chance <= 0.7:
                 # Pick a random adjacent tile to move to
-                directions = list(Direction.all())
-                while len(directions) > 0:
-                    direction = random.choice(directions)
-                    directions.remove(direction)
-                    new_position = self.entity.position + direction
-                    overlaps_existing_entity = any(new_position == ent.position for ent in engine.entities)
-                    try:
-                        point_is_walkable = engine.map.point_is_walkable(new_position)
-                    except ValueError:
-                        point_is_walkable = False
-                    if not overlaps_existing_entity and point_is_walkable:
-                        if engine.map.visible[tuple(self.entity.position)]:
-                            log.AI.info('Hero is NOT visible to %s, bumping %s randomly', self.entity, direction)
-                        action = BumpAction(self.entity, direction)
+                directions = self._walkable_directions(engine)
+                random.shuffle(directions)
+                # Every candidate direction is already known to be walkable, so all that's left is to check whether
+                # another entity is standing there.
+                for direction in directions:
+                    new_position = entity_position + direction
+                    if not engine.entities_at(new_position):
+                        if should_log:
+                            log.AI.info('Hero is NOT visible to %s, bumping %s randomly', entity, direction)
+                        action = BumpAction(entity, direction)
                         break
                 else:
                     # If this entity somehow can't move anywhere, just wait
-                    if engine.map.visible[tuple(self.entity.position)]:
-                        log.AI.info("Hero is NOT visible to %s and it can't move anywhere, waiting", self.entity)
-                    action = WaitAction(self.entity)
+                    if should_log:
+                        log.AI.info("Hero is NOT visible to %s and it can't move anywhere, waiting", entity)
+                    action = WaitAction(entity)
 
                 return action
             else:
-                return WaitAction(self.entity)
+                return WaitAction(entity)
+
+    def _can_see_hero(self, engine: 'Engine') -> bool:
+        '''
+        Return True if the hero is within this entity's field of view.
+
+        Field of view never reaches farther than the sight radius in either axis, so when the hero is farther away than
+        that, it can't be visible and there's no need to compute the field of view at all. A radius of 0 means the
+        entity's sight is unlimited.
+        '''
+        hero_position = engine.hero.position
+        entity_position = self.entity.position
+        sight_radius = self.entity.sight_radius
+
+        distance = max(abs(hero_position.x - entity_position.x), abs(hero_position.y - entity_position.y))
+        if 0 < sight_radius < distance:
+            return False
+
+        window_x, window_y, visible_tiles = self._field_of_view(engine)
+        return bool(visible_tiles[hero_position.x - window_x, hero_position.y - window_y])
+
+    def _field_of_view(self, engine: 'Engine') -> Tuple[int, int, np.ndarray]:
+        '''
+        Compute the field of view of this entity. Return a tuple of (x, y, visible), where `visible` is an array of the
+        tiles visible to this entity in a window of the map whose top left corner is at (x, y).
+
+        Field of view never reaches past the sight radius, so it's computed over just the window of the map within the
+        sight radius of the entity, rather than the whole map. The result is reused until the entity moves.
+        '''
+        position = self.entity.position
+        x = position.x
+        y = position.y
+
+        field_of_view = self.__field_of_view
+        if field_of_view is not None and field_of_view[0] == (x, y):
+            return field_of_view[1:]
+
+        transparent = engine.map.transparent
+        sight_radius = self.entity.sight_radius
+
+        if sight_radius > 0:
+            window_x = max(0, x - sight_radius)
+            window_y = max(0, y - sight_radius)
+            transparent = transparent[window_x:x + sight_radius + 1, window_y:y + sight_radius + 1]
+        else:
+            window_x = 0
+            window_y = 0
+
+        visible = tcod.map.compute_fov(transparent, pov=(x - window_x, y - window_y), radius=sight_radius)
+
+        self.__field_of_view = ((x, y), window_x, window_y, visible)
+
+        return window_x, window_y, visible
+
+    def _walkable_directions(self, engine: 'Engine') -> List[Vector]:
+        '''
+        Return the directions in which the tile adjacent to this entity is in bounds and walkable. All eight neighbors
+        are tested at once with a single lookup into the map's walkable array.
+        '''
+        candidates = Direction.OFFSETS + np.array(tuple(self.entity.position), dtype=np.int32)
+        is_walkable = engine.map.points_are_walkable(candidates[:, 0], candidates[:, 1])
+        return [Direction.from_index(index) for index in np.flatnonzero(is_walkable)]
 
     def get_path_to(self, point: Point, engine: 'Engine') -> List[Point]:
         '''Compute a path to the given position.
@@ -114,15 +179,17 @@ class HostileEnemy(AI):
             An array of Points representing a path from the Entity's position to the target point
         '''
         # Copy the walkable array
-        cost = np.array(engine.map.tiles['walkable'], dtype=np.int8)
-
-        for ent in engine.entities:
-            # Check that an entity blocks movement and the cost isn't zero (blocking)
-            position = ent.position
-            if ent.blocks_movement and cost[position.x, position.y]:
-                # Add to the cost of a blocked position. A lower number means more enemies will crowd behind each other
-                # in hallways. A higher number means enemies will take longer paths in order to surround the player.
-                cost[position.x, position.y] += 10
+        cost = np.array(engine.map.walkable, dtype=np.int8)
+
+        blocking_entity_positions = engine.blocking_entity_positions
+        if blocking_entity_positions:
+            xs, ys = np.array(list(blocking_entity_positions), dtype=np.intp).T
+
+            # Add to the cost of every blocked position, unless the cost is zero (blocking). A lower number means more
+            # enemies will crowd behind each other in hallways. A higher number means enemies will take longer paths in
+            # order to surround the player.
+            is_walkable = cost[xs, ys] != 0
+            cost[xs[is_walkable], ys[is_walkable]] += 10
 
         # Create a graph from the cost array and pass that graph to a new pathfinder.
         graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
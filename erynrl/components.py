@@ -2,12 +2,35 @@
 
 import random
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+
+Color = Tuple[int, int, int]
+
+# Every color a Renderable has been created with. Many entities share a handful of colors, so they share a single tuple
+# for each one instead of each holding their own copy.
+_INTERNED_COLORS: Dict[Color, Color] = {}
+
+
+def _intern_color(color: Optional[Color]) -> Optional[Color]:
+    if color is None:
+        return None
+    color = tuple(color)
+    return _INTERNED_COLORS.setdefault(color, color)
+
+
+def _pack_color(color: Optional[Color]) -> int:
+    if color is None:
+        return 0
+    red, green, blue = color
+    return red | green << 8 | blue << 16 | 0xFF << 24
 
 
 class Component:
     '''A base, abstract Component that implement some aspect of an Entity's behavior.'''
 
+    __slots__ = ()
+
 
 class Fighter(Component):
     '''A Fighter is an Entity that can fight. That is, it has hit points (health), attack, and defense.
@@ -25,6 +48,15 @@ class Fighter(Component):
         The current number of hit points remaining. When this reaches 0, the Fighter dies.
     '''
 
+    # Every monster has its own Fighter, so there can be a lot of them.
+    __slots__ = (
+        'maximum_hit_points',
+        '__hit_points',
+        'attack_power',
+        'defense',
+        '__ticks_since_last_passive_heal',
+        '__ticks_for_next_passive_heal')
+
     def __init__(self, *, maximum_hit_points: int, attack_power: int, defense: int, hit_points: Optional[int] = None):
         self.maximum_hit_points = maximum_hit_points
         self.__hit_points = hit_points if hit_points else maximum_hit_points
@@ -101,16 +133,26 @@ class Renderable(Component):
         self.symbol = symbol
         '''The symbol that represents this renderable on the map'''
 
+        self.codepoint = ord(symbol)
+        '''The Unicode codepoint of `symbol`, ready to write into a console'''
+
         self.order = order
         '''
         Specifies the layer at which this entity is rendered. Higher values are
         rendered later, and thus on top of lower values.
         '''
 
-        self.foreground = fg
+        self.foreground = _intern_color(fg)
         '''The foreground color of the entity'''
 
-        self.background = bg
+        self.packed_foreground = _pack_color(self.foreground)
+        '''
+        The foreground color packed into a single int, laid out so its little-endian bytes are the RGBA bytes of a
+        console tile's foreground, or 0 if this renderable has no foreground color. Drawing gathers these for many
+        renderables at once instead of unpacking a tuple for each one.
+        '''
+
+        self.background = _intern_color(bg)
         '''The background color of the entity'''
 
     def __repr__(self):
@@ -8,8 +8,9 @@ import os.path as osp
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from os import PathLike
-from typing import Iterable
+from typing import Iterable, Optional
 
 import tcod.tileset
 
@@ -34,15 +35,13 @@ class FontConfiguration:
     filename: str | PathLike[str]
 
     @staticmethod
+    @cache
     def __find_fonts_directory():
-        '''Walk up the filesystem tree from this file to find a `fonts` directory.'''
-
-        def walk_up_directories_of_path(path):
-            while path and path != '/':
-                path = osp.dirname(path)
-                yield path
-
-        for parent_dir in walk_up_directories_of_path(__file__):
+        '''
+        Walk up the filesystem tree from this file to find a `fonts` directory. The result is cached, so the filesystem
+        is only searched once per run.
+        '''
+        for parent_dir in log.walk_up_directories_of_path(__file__):
             possible_fonts_dir = osp.join(parent_dir, 'fonts')
             if osp.isdir(possible_fonts_dir):
                 log.ROOT.info('Found fonts dir %s', possible_fonts_dir)
@@ -179,6 +178,9 @@ class Configuration:
         The size of the map in tiles
     sandbox : bool
         If this flag is toggled on, the map is rendered with no shroud
+    seed : Optional[int]
+        A seed for the game's random number generators. Games started with the same seed generate the same maps and
+        monsters, and play out the same way given the same input. If None, every game is different.
     '''
     console_font_configuration: FontConfiguration
 
@@ -186,3 +188,5 @@ class Configuration:
     map_size: Size = MAP_SIZE
 
     sandbox: bool = False
+
+    seed: Optional[int] = None
@@ -3,8 +3,9 @@
 '''Defines the core game engine.'''
 
 import random
-from typing import MutableSet
+from typing import Collection, Dict, List, MutableSet, Optional, Sequence, Tuple
 
+import numpy as np
 import tcod
 
 from . import log
@@ -25,6 +26,7 @@ from .map.generator.room import (
     RoomGenerator,
     RectangularRoomMethod)
 from .messages import MessageLog
+from .geometry import Point
 from .object import Actor, Entity, Hero, Monster
 
 
@@ -38,7 +40,10 @@ class Engine:
     configuration : Configuration
         Defines the basic configuration for the game
     entities : MutableSet[Entity]
-        A set of all the entities on the current map, including the Hero
+        A set of all the entities on the current map, including the Hero. Use `add_entity` and `remove_entity` to
+        change it, so `entities_snapshot` stays up to date.
+    entities_snapshot : List[Entity]
+        A list of all the entities, rebuilt only when entities are added or removed
     hero : Hero
         The hero, the Entity controlled by the player
     map : Map
@@ -54,7 +59,11 @@ class Engine:
         self.did_begin_turn = False
         self.did_successfully_process_actions_for_turn = False
 
-        self.rng = tcod.random.Random()
+        # Seed the generators before anything else uses them, so everything that follows, including the map, is
+        # reproducible from the seed.
+        if config.seed is not None:
+            random.seed(config.seed)
+        self.rng = tcod.random.Random(seed=config.seed)
         self.message_log = MessageLog()
 
         map_generator = RoomsAndCorridorsGenerator(
@@ -76,6 +85,14 @@ class Engine:
         self.event_handler = EngineEventHandler(self)
 
         self.entities: MutableSet[Entity] = set()
+        self._entities_snapshot: List[Entity] = []
+        self._entities_snapshot_is_dirty = True
+
+        # All entities, keyed by their position, so looking up what's on a tile doesn't mean scanning every entity.
+        self._entities_by_position: Dict[Tuple[int, int], List[Entity]] = {}
+
+        # Entities that block movement, keyed by their position. Only one such entity can occupy a tile at a time.
+        self._blocking_entities_by_position: Dict[Tuple[int, int], Entity] = {}
 
         try:
             hero_start_position = self.map.up_stairs[0]
@@ -83,7 +100,11 @@ class Engine:
             hero_start_position = self.map.random_walkable_position()
         self.hero = Hero(position=hero_start_position)
 
-        self.entities.add(self.hero)
+        self.add_entity(self.hero)
+
+        # A bitmap of map positions that already have an entity on them
+        occupied = np.full(self.map.size.numpy_shape, fill_value=False, order='F')
+        occupied[hero_start_position.numpy_index] = True
 
         while len(self.entities) < 25:
             should_spawn_monster_chance = random.random()
@@ -92,7 +113,7 @@ class Engine:
 
             while True:
                 random_start_position = self.map.random_walkable_position()
-                if not any(ent.position == random_start_position for ent in self.entities):
+                if not occupied[random_start_position.numpy_index]:
                     break
 
             spawn_monster_chance = random.random()
@@ -102,12 +123,84 @@ class Engine:
                 monster = Monster(monsters.Orc, ai_class=HostileEnemy, position=random_start_position)
 
             log.ENGINE.info('Spawning %s', monster)
-            self.entities.add(monster)
+            self.add_entity(monster)
+            occupied[random_start_position.numpy_index] = True
 
         self.update_field_of_view()
 
         self.message_log.add_message('Greetings adventurer!', fg=(127, 127, 255), stack=False)
 
+    @property
+    def entities_snapshot(self) -> List[Entity]:
+        '''
+        A list of all the entities on the map. The list is only rebuilt after entities are added or removed, so it's
+        cheap to get every turn. Adding or removing entities replaces the list rather than modifying it, so it's safe to
+        add or remove entities while iterating a snapshot. Don't modify the returned list.
+
+        The entities are in the order they were created. The order of `entities` depends on where the entities are in
+        memory, and entities take their turns in snapshot order, so a stable order keeps seeded games reproducible.
+        '''
+        if self._entities_snapshot_is_dirty:
+            self._entities_snapshot = sorted(self.entities, key=lambda e: e.identifier)
+            self._entities_snapshot_is_dirty = False
+        return self._entities_snapshot
+
+    def add_entity(self, entity: Entity) -> None:
+        '''Add an entity to the map'''
+        self.entities.add(entity)
+        self._entities_snapshot_is_dirty = True
+
+        position = entity.position.numpy_index
+        self._entities_by_position.setdefault(position, []).append(entity)
+
+        if entity.blocks_movement:
+            self._blocking_entities_by_position[position] = entity
+
+    def remove_entity(self, entity: Entity) -> None:
+        '''Remove an entity from the map'''
+        self.entities.remove(entity)
+        self._entities_snapshot_is_dirty = True
+
+        position = entity.position.numpy_index
+        self.__remove_entity_from_position(entity, position)
+
+        if entity.blocks_movement:
+            del self._blocking_entities_by_position[position]
+
+    def move_entity(self, entity: Entity, position: Point) -> None:
+        '''Move an entity to a new position on the map'''
+        old_position = entity.position.numpy_index
+        new_position = position.numpy_index
+
+        self.__remove_entity_from_position(entity, old_position)
+        self._entities_by_position.setdefault(new_position, []).append(entity)
+
+        if entity.blocks_movement:
+            blocking_entities = self._blocking_entities_by_position
+            del blocking_entities[old_position]
+            blocking_entities[new_position] = entity
+
+        entity.position = position
+
+    def __remove_entity_from_position(self, entity: Entity, position: Tuple[int, int]) -> None:
+        entities_at_position = self._entities_by_position[position]
+        entities_at_position.remove(entity)
+        if not entities_at_position:
+            del self._entities_by_position[position]
+
+    def entities_at(self, position: Point) -> Sequence[Entity]:
+        '''Return all the entities at the given position. Don't modify the returned sequence.'''
+        return self._entities_by_position.get(position.numpy_index, ())
+
+    def blocking_entity_at(self, position: Point) -> Optional[Entity]:
+        '''Return the entity that blocks movement at the given position, if there is one'''
+        return self._blocking_entities_by_position.get(position.numpy_index)
+
+    @property
+    def blocking_entity_positions(self) -> Collection[Tuple[int, int]]:
+        '''The (x, y) coordinates of every tile with an entity that blocks movement on it'''
+        return self._blocking_entities_by_position.keys()
+
     def process_input_action(self, action: Action):
         '''Process an Action from player input'''
         if not isinstance(action, Action):
@@ -119,6 +212,8 @@ class Engine:
         log.ACTIONS_TREE.info('Processing Hero Actions')
         log.ACTIONS_TREE.info('|-> %s', action.actor)
 
+        hero_position = self.hero.position
+
         result = self._perform_action_until_done(action)
 
         # Player's action failed, don't proceed with turn.
@@ -128,7 +223,11 @@ class Engine:
 
         self.did_successfully_process_actions_for_turn = True
         self.process_entity_actions()
-        self.update_field_of_view()
+
+        # The hero's field of view only depends on where they're standing, so it only needs to be recomputed if they
+        # moved this turn.
+        if self.hero.position != hero_position:
+            self.update_field_of_view()
 
         self.finish_turn()
 
@@ -136,14 +235,23 @@ class Engine:
         '''Run AI for entities that have them, and process actions from those AIs'''
         hero_position = self.hero.position
 
-        # Copy the list so we only act on the entities that exist at the start of this turn. Sort it by Euclidean
-        # distance to the Hero, so entities closer to the hero act first.
-        entities = sorted(
-            self.entities,
-            key=lambda e: e.position.euclidean_distance_to(hero_position))
+        # Only act on the entities that exist at the start of this turn. Sort them by Euclidean distance to the Hero, so
+        # entities closer to the hero act first. Gather every position into one array so the distances are computed in a
+        # single pass; ordering by squared distance is the same as ordering by distance.
+        entities = self.entities_snapshot
+        positions = np.array([ent.position.numpy_index for ent in entities], dtype=np.int32).reshape(-1, 2)
+        offsets_from_hero = positions - np.array(hero_position.numpy_index, dtype=np.int32)
+        squared_distances = (offsets_from_hero ** 2).sum(axis=1)
+        entities = [entities[i] for i in np.argsort(squared_distances, kind='stable')]
 
         log.ACTIONS_TREE.info('Processing Entity Actions')
 
+        # Bind everything the loop touches to locals up front; this loop runs once per entity per turn.
+        should_log = log.ACTIONS_TREE.isEnabledFor(log.INFO)
+        visible = self.map.visible
+        last_index = len(entities) - 1
+        perform_action_until_done = self._perform_action_until_done
+
         for i, ent in enumerate(entities):
             if not isinstance(ent, Actor):
                 continue
@@ -152,29 +260,22 @@ class Engine:
             if not ent_ai:
                 continue
 
-            if self.map.visible[tuple(ent.position)]:
-                log.ACTIONS_TREE.info('%s-> %s', '|' if i < len(entities) - 1 else '`', ent)
+            if should_log and visible[ent.position.numpy_index]:
+                log.ACTIONS_TREE.info('%s-> %s', '|' if i < last_index else '`', ent)
 
             action = ent_ai.act(engine=self)
             if action:
-                self._perform_action_until_done(action)
+                perform_action_until_done(action)
 
     def _perform_action_until_done(self, action: Action) -> ActionResult:
         '''Perform the given action and any alternate follow-up actions until the action chain is done.'''
-        result = action.perform(self)
+        # Check the log level once for the whole chain so the log arguments are only built when they'll be used.
+        should_log = log.ACTIONS_TREE.isEnabledFor(log.INFO)
+        visible = self.map.visible
 
-        if log.ACTIONS_TREE.isEnabledFor(log.INFO) and self.map.visible[tuple(action.actor.position)]:
-            if result.alternate:
-                alternate_string = f'{result.alternate.__class__.__name__}[{result.alternate.actor}]'
-            else:
-                alternate_string = str(result.alternate)
-            log.ACTIONS_TREE.info(
-                '|   %s-> %s => success=%s done=%s alternate=%s',
-                '|' if not result.success or not result.done else '`',
-                action,
-                result.success,
-                result.done,
-                alternate_string)
+        result = action.perform(self)
+        if should_log and visible[action.actor.position.numpy_index]:
+            self._log_action_result(action, result)
 
         while not result.done:
             assert result.alternate is not None, f'Action {result.action} incomplete but no alternate action given'
@@ -182,31 +283,37 @@ class Engine:
             action = result.alternate
             result = action.perform(self)
 
-            if log.ACTIONS_TREE.isEnabledFor(log.INFO) and self.map.visible[tuple(action.actor.position)]:
-                if result.alternate:
-                    alternate_string = f'{result.alternate.__class__.__name__}[{result.alternate.actor}]'
-                else:
-                    alternate_string = str(result.alternate)
-                log.ACTIONS_TREE.info(
-                    '|   %s-> %s => success=%s done=%s alternate=%s',
-                    '|' if not result.success or not result.done else '`',
-                    action,
-                    result.success,
-                    result.done,
-                    alternate_string)
+            if should_log and visible[action.actor.position.numpy_index]:
+                self._log_action_result(action, result)
 
             if result.success:
                 break
 
         return result
 
+    @staticmethod
+    def _log_action_result(action: Action, result: ActionResult) -> None:
+        alternate = result.alternate
+        if alternate:
+            alternate_string = f'{alternate.__class__.__name__}[{alternate.actor}]'
+        else:
+            alternate_string = str(alternate)
+
+        log.ACTIONS_TREE.info(
+            '|   %s-> %s => success=%s done=%s alternate=%s',
+            '|' if not result.success or not result.done else '`',
+            action,
+            result.success,
+            result.done,
+            alternate_string)
+
     def update_field_of_view(self):
-        '''Compute visible area of the map based on the player's position and point of view.'''
+        '''
+        Compute visible area of the map based on the player's position and point of view. The map adds the visible
+        tiles to its explored tiles.
+        '''
         self.map.update_visible_tiles(self.hero.position, self.hero.sight_radius)
 
-        # Add visible tiles to the explored grid
-        self.map.explored |= self.map.visible
-
     def begin_turn(self) -> None:
         '''Begin the current turn'''
         if self.did_begin_turn:
@@ -239,4 +346,4 @@ class Engine:
             self.event_handler = GameOverEventHandler(self)
         else:
             log.ACTIONS.info('%s dies', actor)
-            self.entities.remove(actor)
+            self.remove_entity(actor)
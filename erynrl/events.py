@@ -13,48 +13,44 @@ if TYPE_CHECKING:
     from .engine import Engine
 
 
-class EngineEventHandler(tev.EventDispatch[Action]):
-    '''Handles event on behalf of the game engine, dispatching Actions back to the engine.'''
+class EventHandler(tev.EventDispatch[Action]):
+    '''Abstract base class of event handlers that dispatch Actions back to the game engine.'''
 
     def __init__(self, engine: 'Engine'):
         super().__init__()
         self.engine = engine
 
-    def ev_keydown(self, event: tev.KeyDown) -> Optional[Action]:
-        action: Optional[Action] = None
 
-        hero = self.engine.hero
+# Movement keys, mapped to the direction the hero moves when they're pressed. Built once, when this module is loaded.
+_MOVEMENT_KEYS = {
+    tcod.event.KeySym.b: Direction.SouthWest,
+    tcod.event.KeySym.h: Direction.West,
+    tcod.event.KeySym.j: Direction.South,
+    tcod.event.KeySym.k: Direction.North,
+    tcod.event.KeySym.l: Direction.East,
+    tcod.event.KeySym.n: Direction.SouthEast,
+    tcod.event.KeySym.u: Direction.NorthEast,
+    tcod.event.KeySym.y: Direction.NorthWest,
+}
 
-        is_shift_pressed = bool(event.mod & tcod.event.Modifier.SHIFT)
 
+class EngineEventHandler(EventHandler):
+    '''Handles event on behalf of the game engine, dispatching Actions back to the engine.'''
+
+    def ev_keydown(self, event: tev.KeyDown) -> Optional[Action]:
         sym = event.sym
-        match sym:
-            case tcod.event.KeySym.b:
-                action = BumpAction(hero, Direction.SouthWest)
-            case tcod.event.KeySym.h:
-                action = BumpAction(hero, Direction.West)
-            case tcod.event.KeySym.j:
-                action = BumpAction(hero, Direction.South)
-            case tcod.event.KeySym.k:
-                action = BumpAction(hero, Direction.North)
-            case tcod.event.KeySym.l:
-                action = BumpAction(hero, Direction.East)
-            case tcod.event.KeySym.n:
-                action = BumpAction(hero, Direction.SouthEast)
-            case tcod.event.KeySym.u:
-                action = BumpAction(hero, Direction.NorthEast)
-            case tcod.event.KeySym.y:
-                action = BumpAction(hero, Direction.NorthWest)
-            case tcod.event.KeySym.PERIOD:
-                if not is_shift_pressed:
-                    action = WaitAction(hero)
-
-        return action
-
-
-class GameOverEventHandler(tev.EventDispatch[Action]):
-    '''When the game is over (the hero dies, the player quits, etc), this event handler takes over.'''
 
-    def __init__(self, engine: 'Engine'):
-        super().__init__()
-        self.engine = engine
+        direction = _MOVEMENT_KEYS.get(sym)
+        if direction:
+            return BumpAction(self.engine.hero, direction)
+
+        if sym == tcod.event.KeySym.PERIOD:
+            is_shift_pressed = bool(event.mod & tcod.event.Modifier.SHIFT)
+            if not is_shift_pressed:
+                return WaitAction(self.engine.hero)
+
+        return None
+
+
+class GameOverEventHandler(EventHandler):
+    '''When the game is over (the hero dies, the player quits, etc), this event handler takes over.'''
@@ -4,16 +4,31 @@
 
 import math
 from dataclasses import dataclass
-from typing import Iterator, Optional, overload, Tuple
+from functools import cached_property
+from typing import Dict, Iterator, Optional, overload, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Point:
     '''A two-dimensional point, with coordinates in X and Y axes'''
 
     x: int = 0
     y: int = 0
 
+    # Points are compared and used as set members and dictionary keys all over the place. Compare and hash the
+    # coordinates directly rather than going through a tuple of the fields each time. Points are hashable, so don't
+    # change the coordinates of one that's in a set or a dictionary.
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not Point:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return self.x * 73856093 ^ self.y * 19349663
+
     @property
     def numpy_index(self) -> Tuple[int, int]:
         '''Convert this Point into a tuple suitable for indexing into a numpy map array'''
@@ -22,8 +37,10 @@ class Point:
     @property
     def neighbors(self) -> Iterator['Point']:
         '''Iterator over the neighboring points of `self` in all eight directions.'''
-        for direction in Direction.all():
-            yield self + direction
+        x = self.x
+        y = self.y
+        for dx, dy in Direction.OFFSET_TUPLES:
+            yield Point(x + dx, y + dy)
 
     def is_adjacent_to(self, other: 'Point') -> bool:
         '''Check if this point is adjacent to, but not overlapping the given point
@@ -38,22 +55,17 @@ class Point:
         bool
             True if this point is adjacent to the other point
         '''
-        if self == other:
-            return False
-
-        return (self.x - 1 <= other.x <= self.x + 1) and (self.y - 1 <= other.y <= self.y + 1)
+        # Check the offsets between the points, which also rules out the point itself.
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return -1 <= dx <= 1 and -1 <= dy <= 1 and (dx != 0 or dy != 0)
 
     def direction_to_adjacent_point(self, other: 'Point') -> Optional['Vector']:
         '''
         Given a point directly adjacent to `self`, return a Vector indicating in
         which direction it is adjacent.
         '''
-        for direction in Direction.all():
-            if (self + direction) != other:
-                continue
-            return direction
-
-        return None
+        return Direction.from_offset(other.x - self.x, other.y - self.y)
 
     def euclidean_distance_to(self, other: 'Point') -> float:
         '''Compute the Euclidean distance to another Point'''
@@ -63,14 +75,17 @@ class Point:
         '''Compute the Manhattan distance to another Point'''
         return abs(self.x - other.x) + abs(self.y - other.y)
 
+    # Point arithmetic is on a lot of hot paths. The type checks below are debugging aids, so they're skipped when
+    # Python runs with optimizations enabled (-O).
+
     def __add__(self, other: 'Vector') -> 'Point':
-        if not isinstance(other, Vector):
+        if __debug__ and not isinstance(other, Vector):
             raise TypeError('Only Vector can be added to a Point')
         return Point(self.x + other.dx, self.y + other.dy)
 
     def __sub__(self, other: 'Vector') -> 'Point':
-        if not isinstance(other, Vector):
-            raise TypeError('Only Vector can be added to a Point')
+        if __debug__ and not isinstance(other, Vector):
+            raise TypeError('Only Vector can be subtracted from a Point')
         return Point(self.x - other.dx, self.y - other.dy)
 
     def __lt__(self, other: 'Point') -> bool:
@@ -93,7 +108,7 @@ class Point:
         return f'(x:{self.x}, y:{self.y})'
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector:
     '''A two-dimensional vector, representing change in position in X and Y axes'''
 
@@ -117,6 +132,15 @@ class Direction:
     '''
     A collection of simple uint vectors in each of the eight major compass
     directions. This is a namespace, not a class.
+
+    ### Attributes
+
+    `OFFSETS`: np.ndarray
+        A read-only 8x2 array of (dx, dy) offsets, one row per direction, in the same clockwise order as `all()`.
+        Use this for vectorized lookups instead of iterating over the Vectors.
+    `OFFSET_TUPLES`: Tuple[Tuple[int, int], ...]
+        The same (dx, dy) offsets as plain tuples of ints, in the same order. Use this to loop over offsets in Python
+        without reading them out of the Vectors.
     '''
 
     North = Vector(0, -1)
@@ -128,17 +152,39 @@ class Direction:
     West = Vector(-1, 0)
     NorthWest = Vector(-1, -1)
 
+    OFFSETS = np.array([
+        (0, -1),
+        (1, -1),
+        (1, 0),
+        (1, 1),
+        (0, 1),
+        (-1, 1),
+        (-1, 0),
+        (-1, -1),
+    ], dtype=np.int32)
+    OFFSETS.setflags(write=False)
+
+    _ALL: Tuple[Vector, ...] = (North, NorthEast, East, SouthEast, South, SouthWest, West, NorthWest)
+    _BY_OFFSET: Dict[Tuple[int, int], Vector] = {(d.dx, d.dy): d for d in _ALL}
+    OFFSET_TUPLES: Tuple[Tuple[int, int], ...] = tuple(_BY_OFFSET)
+
     @classmethod
-    def all(cls) -> Iterator[Vector]:
-        '''Iterate through all directions, starting with North and proceeding clockwise'''
-        yield Direction.North
-        yield Direction.NorthEast
-        yield Direction.East
-        yield Direction.SouthEast
-        yield Direction.South
-        yield Direction.SouthWest
-        yield Direction.West
-        yield Direction.NorthWest
+    def all(cls) -> Tuple[Vector, ...]:
+        '''
+        All directions, starting with North and proceeding clockwise. This is the same tuple every time, so it's cheap
+        to call in a loop.
+        '''
+        return cls._ALL
+
+    @classmethod
+    def from_index(cls, index: int) -> Vector:
+        '''Get the direction Vector for an index into `OFFSETS`'''
+        return cls._ALL[index]
+
+    @classmethod
+    def from_offset(cls, dx: int, dy: int) -> Optional[Vector]:
+        '''Get the direction Vector with the given offsets, or None if there isn't one'''
+        return cls._BY_OFFSET.get((dx, dy))
 
 
 @dataclass
@@ -161,10 +207,13 @@ class Size:
         return f'(w:{self.width}, h:{self.height})'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Rect:
     '''
     A two-dimensional rectangle defined by an origin point and size
+
+    Rects are immutable, so the coordinates derived from the origin and size are computed the first time they're
+    accessed and cached on the instance.
     '''
 
     origin: Point
@@ -175,42 +224,42 @@ class Rect:
         '''Create a rect from raw (unpacked from their struct) values'''
         return Rect(Point(x, y), Size(width, height))
 
-    @property
+    @cached_property
     def min_x(self) -> int:
         '''Minimum x-value that is still within the bounds of this rectangle. This is the origin's x-value.'''
         return self.origin.x
 
-    @property
+    @cached_property
     def min_y(self) -> int:
         '''Minimum y-value that is still within the bounds of this rectangle. This is the origin's y-value.'''
         return self.origin.y
 
-    @property
+    @cached_property
     def mid_x(self) -> int:
         '''The x-value of the center point of this rectangle.'''
         return self.origin.x + self.size.width // 2
 
-    @property
+    @cached_property
     def mid_y(self) -> int:
         '''The y-value of the center point of this rectangle.'''
         return self.origin.y + self.size.height // 2
 
-    @property
+    @cached_property
     def max_x(self) -> int:
         '''Maximum x-value that is still within the bounds of this rectangle.'''
         return self.origin.x + self.size.width - 1
 
-    @property
+    @cached_property
     def max_y(self) -> int:
         '''Maximum y-value that is still within the bounds of this rectangle.'''
         return self.origin.y + self.size.height - 1
 
-    @property
+    @cached_property
     def end_x(self) -> int:
         '''X-value beyond the end of the rectangle.'''
         return self.origin.x + self.size.width
 
-    @property
+    @cached_property
     def end_y(self) -> int:
         '''Y-value beyond the end of the rectangle.'''
         return self.origin.y + self.size.height
@@ -225,10 +274,12 @@ class Rect:
         '''The height of the rectangle. A convenience property for accessing `self.size.height`.'''
         return self.size.height
 
-    @property
+    @cached_property
     def midpoint(self) -> Point:
         '''A Point in the middle of the Rect'''
-        return Point(self.mid_x, self.mid_y)
+        origin = self.origin
+        size = self.size
+        return Point(origin.x + size.width // 2, origin.y + size.height // 2)
 
     @property
     def corners(self) -> Iterator[Point]:
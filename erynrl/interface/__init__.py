@@ -4,7 +4,7 @@
 The game's graphical user interface
 '''
 
-from typing import NoReturn
+from typing import List, NoReturn
 
 from tcod import event as tev
 from tcod.console import Console
@@ -14,6 +14,8 @@ from .events import InterfaceEventHandler
 from .window.info import InfoWindow
 from .window.map import MapWindow
 from .window.message_log import MessageLogWindow
+from ..actions.action import Action
+from ..actions.game import MoveAction
 from ..engine import Engine
 from ..geometry import Rect, Size
 
@@ -45,7 +47,7 @@ class Interface:
         hero = self.engine.hero
         self.info_window.update_hero(hero)
 
-        sorted_entities = sorted(filter(lambda e: e.renderable is not None, self.engine.entities),
+        sorted_entities = sorted(filter(lambda e: e.renderable is not None, self.engine.entities_snapshot),
                                  key=lambda e: e.renderable.order.value)
         self.map_window.entities = sorted_entities
 
@@ -57,22 +59,56 @@ class Interface:
 
     def run_event_loop(self, context: Context) -> NoReturn:
         '''Run the event loop forever. This method never returns.'''
-        while True:
-            self.update()
-
-            self.console.clear()
-            self.draw()
-            context.present(self.console)
+        needs_redraw = True
 
+        while True:
+            # Only redraw when something happened that could have changed what's on screen.
+            if needs_redraw:
+                self.update()
+
+                self.console.clear()
+                self.draw()
+                context.present(self.console)
+
+                needs_redraw = False
+
+            # tev.wait() blocks in SDL_WaitEvent until there's at least one event, then returns everything that's
+            # queued, so the game doesn't use any CPU while it's waiting for input.
+            #
+            # Dispatch every event that arrived since the last frame. A held movement key can queue up several repeats
+            # between frames; running a full turn for each of them would only make the game lag behind the keyboard, so
+            # consecutive movement actions are coalesced into the last one. Every other action runs in the order it
+            # arrived.
+            #
+            # Every event in the batch goes to the engine's event handler before any of their actions run, so if one of
+            # the actions changes the handler (e.g. the hero dies and the game is over), the rest of the actions no
+            # longer apply and are dropped.
+            engine_event_handler = self.engine.event_handler
+            actions: List[Action] = []
             for event in tev.wait():
                 context.convert_event(event)
                 did_handle = self.event_handler.dispatch(event)
                 if did_handle:
+                    needs_redraw = True
                     continue
 
-                action = self.engine.event_handler.dispatch(event)
+                action = engine_event_handler.dispatch(event)
                 if not action:
-                    # The engine didn't handle the event, so just drop it.
+                    # The engine didn't handle the event, so just drop it. Keys that didn't do anything, and the text
+                    # input events SDL sends along with printable keys, leave the screen as it was, but other events
+                    # (mouse movement, window changes) can still affect it.
+                    if not isinstance(event, (tev.KeyDown, tev.KeyUp, tev.TextInput)):
+                        needs_redraw = True
                     continue
 
+                if actions and isinstance(action, MoveAction) and isinstance(actions[-1], MoveAction):
+                    actions[-1] = action
+                else:
+                    actions.append(action)
+
+            for action in actions:
+                if self.engine.event_handler is not engine_event_handler:
+                    break
+
                 self.engine.process_input_action(action)
+                needs_redraw = True
@@ -4,7 +4,7 @@
 Declares the MapWindow class.
 '''
 
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import tcod.event as tev
@@ -157,10 +157,13 @@ class MapWindow(Window):
 
         self.visible_map_bounds = self._update_visible_map_bounds()
         self._draw_bounds = self._update_draw_bounds()
-        self._draw_map(console)
-        self._draw_entities(console)
 
-    def _draw_map(self, console: Console):
+        # Compositing the map is a pass over every tile, so do it once per frame and share the result.
+        composited_tiles = self.map.composited_tiles
+        self._draw_map(console, composited_tiles)
+        self._draw_entities(console, composited_tiles)
+
+    def _draw_map(self, console: Console, composited_tiles: np.ndarray):
         drawable_map_bounds = self.visible_map_bounds
 
         map_slice = np.s_[
@@ -172,38 +175,84 @@ class MapWindow(Window):
             console_draw_bounds.min_x: console_draw_bounds.max_x + 1,
             console_draw_bounds.min_y: console_draw_bounds.max_y + 1]
 
-        console.tiles_rgb[console_slice] = self.map.composited_tiles[map_slice]
+        # The console and the map are both Fortran-ordered and indexed [x, y], so this copies whole columns of tiles at
+        # a time rather than striding across the console.
+        console.rgb[console_slice] = composited_tiles[map_slice]
+
+    def _draw_entities(self, console: Console, composited_tiles: np.ndarray):
+        entities = self.entities
+        if not entities:
+            return
+
+        # Gather the positions of all the entities into arrays, and figure out which ones to draw all at once: only
+        # entities that are within the visible map bounds and in the field of view get drawn.
+        number_of_entities = len(entities)
+        xs = np.fromiter((ent.position.x for ent in entities), dtype=np.intp, count=number_of_entities)
+        ys = np.fromiter((ent.position.y for ent in entities), dtype=np.intp, count=number_of_entities)
 
-    def _draw_entities(self, console: Console):
         visible_map_bounds = self.visible_map_bounds
-        map_bounds_vector = Vector.from_point(self.visible_map_bounds.origin)
-        draw_bounds_vector = Vector.from_point(self._draw_bounds.origin)
+        is_drawn = ((xs >= visible_map_bounds.min_x) & (xs <= visible_map_bounds.max_x)
+                    & (ys >= visible_map_bounds.min_y) & (ys <= visible_map_bounds.max_y))
+        is_drawn[is_drawn] = self.map.visible[xs[is_drawn], ys[is_drawn]]
+
+        indexes_of_drawn_entities = np.flatnonzero(is_drawn)
+        if len(indexes_of_drawn_entities) == 0:
+            return
+
+        xs = xs[indexes_of_drawn_entities]
+        ys = ys[indexes_of_drawn_entities]
+
+        # Entities are sorted in the order they should be drawn, so when several entities share a tile, only the last
+        # one should show up.
+        last_entity_on_each_tile = self._last_entity_on_each_tile(xs, ys)
+        if last_entity_on_each_tile is not None:
+            indexes_of_drawn_entities = indexes_of_drawn_entities[last_entity_on_each_tile]
+            xs = xs[last_entity_on_each_tile]
+            ys = ys[last_entity_on_each_tile]
+
+        # Start from the map tiles under the entities, so each entity is drawn over the background of its tile.
+        graphics = self._entity_graphics([entities[index] for index in indexes_of_drawn_entities],
+                                         composited_tiles[xs, ys])
+
+        # Entity positions are relative to the (0, 0) point of the Map. In order to render them in the correct position
+        # in the console, transform them into viewport-relative coordinates. There's at most one entity per tile now,
+        # so every index in this assignment is distinct.
+        draw_bounds = self._draw_bounds
+        console.rgb[xs + (draw_bounds.min_x - visible_map_bounds.min_x),
+                    ys + (draw_bounds.min_y - visible_map_bounds.min_y)] = graphics
+
+    def _last_entity_on_each_tile(self, xs: np.ndarray, ys: np.ndarray) -> Optional[np.ndarray]:
+        '''
+        Return the sorted indexes of the last entity on each tile, given the entities' positions, or None if no two
+        entities share a tile.
 
-        for ent in self.entities:
-            entity_position = ent.position
+        numpy doesn't define which write wins when an index repeats in an assignment, so the caller has to drop all but
+        one entity on each tile itself. np.unique finds the first occurrence of each tile, so search in reverse.
+        '''
+        tile_indexes = np.ravel_multi_index((xs, ys), self.map.visible.shape)
+        _, last_occurrences_from_end = np.unique(tile_indexes[::-1], return_index=True)
+        if len(last_occurrences_from_end) == len(tile_indexes):
+            return None
 
-            # Only draw entities that are within the visible map bounds
-            if entity_position not in visible_map_bounds:
-                continue
+        return np.sort(len(tile_indexes) - 1 - last_occurrences_from_end)
 
-            # Only draw entities that are in the field of view
-            if not self.map.point_is_visible(entity_position):
-                continue
+    @staticmethod
+    def _entity_graphics(entities: List[Entity], tiles: np.ndarray) -> np.ndarray:
+        '''
+        Fill in the entities' symbols and colors over the given map tiles, one per entity, and return them.
 
-            renderable = ent.renderable
-            if not renderable:
-                continue
+        Foreground colors are gathered packed into one int each, and written over the tiles' foregrounds, read as ints
+        too, wherever an entity has a color of its own.
+        '''
+        count = len(entities)
+        renderables = [entity.renderable for entity in entities]
+        codepoints = np.fromiter((r.codepoint for r in renderables), dtype=np.int32, count=count)
+        packed_foregrounds = np.fromiter((r.packed_foreground for r in renderables), dtype='<u4', count=count)
 
-            # Entity positions are relative to the (0, 0) point of the Map. In
-            # order to render them in the correct position in the console, we
-            # need to transform them into viewport-relative coordinates.
-            map_tile_at_entity_position = self.map.composited_tiles[entity_position.numpy_index]
+        tiles['ch'] = codepoints
 
-            position = ent.position - map_bounds_vector + draw_bounds_vector
+        foregrounds = np.ascontiguousarray(tiles['fg']).view('<u4').ravel()
+        np.copyto(foregrounds, packed_foregrounds, where=packed_foregrounds != 0)
+        tiles['fg'] = foregrounds.view(np.uint8).reshape(-1, 4)
 
-            console.print(
-                x=position.x,
-                y=position.y,
-                string=renderable.symbol,
-                fg=renderable.foreground,
-                bg=tuple(map_tile_at_entity_position['bg'][:3]))
+        return tiles
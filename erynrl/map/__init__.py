@@ -15,7 +15,8 @@ from ..configuration import Configuration
 from ..geometry import Point, Rect, Size
 from .generator import MapGenerator
 from .room import Corridor, Room
-from .tile import Empty, Shroud
+from .tile import (GRAPHICS_BY_STATE_AND_CODE, TRANSPARENT_BY_CODE, WALKABLE_BY_CODE, TileCode, graphic_datatype,
+                   tiles_from_codes)
 
 
 class Map:
@@ -28,7 +29,16 @@ class Map:
         self._bounds = Rect(Point(), map_size)
 
         shape = map_size.numpy_shape
-        self.tiles = np.full(shape, fill_value=Empty, order='F')
+
+        # The map's dimensions never change. Keep them around as plain ints for bounds checks, which happen every time
+        # something moves.
+        self._width, self._height = shape
+
+        self.tile_codes = np.full(shape, fill_value=TileCode.Empty, dtype=np.uint8, order='F')
+        '''
+        The map's tiles as an array of `TileCode`s. Generators build the map here, and the generated codes are
+        converted to `tiles` once generation is done.
+        '''
 
         self.highlighted = np.full(shape, fill_value=False, order='F')
 
@@ -38,10 +48,33 @@ class Map:
         should_mark_all_tiles_explored = config.sandbox
         self.explored = np.full(shape, fill_value=should_mark_all_tiles_explored, order='F')
 
-        self.__walkable_points = None
+        # An Nx2 array of the coordinates of every walkable tile, built the first time a random walkable position is
+        # requested.
+        self.__walkable_coordinates = None
+
+        # Scratch buffers for compositing the map. They're reused every time the map is composited so drawing a frame
+        # doesn't allocate two new map-sized arrays.
+        self.__composite_index = np.zeros(shape, dtype=np.uint8, order='F')
+        self.__composited_tiles = np.zeros(shape, dtype=graphic_datatype, order='F')
+
+        # The composited tiles only change when the visible, explored, or highlighted tiles do. Those only change once a
+        # turn, or when the mouse moves, but the map is drawn every frame.
+        self.__composited_tiles_need_update = True
 
         generator.generate(self)
 
+        self.tiles = tiles_from_codes(self.tile_codes)
+
+        # The walkable and transparent fields of the tiles, each in its own contiguous array. Field of view,
+        # pathfinding, and movement checks only need one of these fields, and reading them out of the tile structs
+        # means striding over all the graphics data packed around them. They're looked up from the tile codes, one byte
+        # per tile, rather than copied out of the tiles. The tiles don't change once the map is generated, so these are
+        # read-only.
+        self.walkable = np.asfortranarray(WALKABLE_BY_CODE[self.tile_codes])
+        self.walkable.setflags(write=False)
+        self.transparent = np.asfortranarray(TRANSPARENT_BY_CODE[self.tile_codes])
+        self.transparent.setflags(write=False)
+
         # Map Features
         self.rooms: List[Room] = []
         self.corridors: List[Corridor] = []
@@ -60,40 +93,74 @@ class Map:
 
     @property
     def composited_tiles(self) -> np.ndarray:
-        # TODO: Hold onto the result here so that this doen't have to be done every time this property is called.
-        return np.select(
-            condlist=[
-                self.highlighted,
-                self.visible,
-                self.explored],
-            choicelist=[
-                self.tiles['highlighted'],
-                self.tiles['light'],
-                self.tiles['dark']],
-            default=Shroud)
+        '''
+        The graphic to draw for every tile of the map: the highlighted graphic for highlighted tiles, the light graphic
+        for visible tiles, the dark graphic for explored tiles, and Shroud for everything else.
+
+        The returned array is a buffer owned by the map. It's only recomputed after the visible, explored, or
+        highlighted tiles change, and it's overwritten when that happens. Copy it if you need to hold onto it.
+        '''
+        composited_tiles = self.__composited_tiles
+        if not self.__composited_tiles_need_update:
+            return composited_tiles
+
+        # Compute the state of each tile: 0 for shrouded, 1 for explored, 2 for visible, and 3 for highlighted. Visible
+        # tiles are always explored, so adding the two masks counts up to the right state without any masked writes,
+        # and highlighting takes precedence over both. Combine that with each tile's code into an index into the
+        # flattened table of graphics, then gather all the graphics in one pass. The table has one graphic per kind of
+        # tile rather than per map tile, so it stays small no matter how big the map is.
+        index = self.__composite_index
+        np.add(self.explored, self.visible, out=index, dtype=np.uint8)
+        np.copyto(index, 3, where=self.highlighted)
+        index *= len(TileCode)
+        index += self.tile_codes
+
+        np.take(GRAPHICS_BY_STATE_AND_CODE.ravel(), index, out=composited_tiles, mode='clip')
+        self.__composited_tiles_need_update = False
+
+        return composited_tiles
 
     def update_visible_tiles(self, point: Point, radius: int):
-        field_of_view = tcod.map.compute_fov(self.tiles['transparent'], tuple(point), radius=radius)
+        '''Compute the tiles visible from the given point, and add them to the explored tiles.'''
+        field_of_view = tcod.map.compute_fov(self.transparent, tuple(point), radius=radius)
 
         # The player's computed field of view
         self.visible[:] = field_of_view
 
+        # Add visible tiles to the explored grid
+        self.explored |= field_of_view
+
+        self.__composited_tiles_need_update = True
+
     def random_walkable_position(self) -> Point:
         '''Return a random walkable point on the map.'''
-        if not self.__walkable_points:
-            self.__walkable_points = [Point(x, y) for x, y in np.ndindex(
-                self.tiles.shape) if self.tiles[x, y]['walkable']]
-        return random.choice(self.__walkable_points)
+        coordinates = self.__walkable_coordinates
+        if coordinates is None:
+            coordinates = np.argwhere(self.walkable)
+            coordinates.setflags(write=False)
+            self.__walkable_coordinates = coordinates
+
+        x, y = coordinates[random.randrange(len(coordinates))]
+        return Point(int(x), int(y))
 
     def point_is_in_bounds(self, point: Point) -> bool:
         '''Return True if the given point is inside the bounds of the map'''
-        return 0 <= point.x < self.size.width and 0 <= point.y < self.size.height
+        return 0 <= point.x < self._width and 0 <= point.y < self._height
 
     def point_is_walkable(self, point: Point) -> bool:
         '''Return True if the tile at the given point is walkable'''
         if not self.point_is_in_bounds(point):
             raise ValueError(f'Point {point!s} is not in bounds')
-        return self.tiles[point.numpy_index]['walkable']
+        return self.walkable[point.numpy_index]
+
+    def points_are_walkable(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        '''
+        Check many points at once. Return an array of bools, True where the point at (xs[i], ys[i]) is in bounds and
+        walkable. Unlike `point_is_walkable`, points out of bounds aren't an error; they're just not walkable.
+        '''
+        is_walkable = (xs >= 0) & (xs < self._width) & (ys >= 0) & (ys < self._height)
+        is_walkable[is_walkable] = self.walkable[xs[is_walkable], ys[is_walkable]]
+        return is_walkable
 
     def point_is_visible(self, point: Point) -> bool:
         '''Return True if the point is visible to the player'''
@@ -114,11 +181,13 @@ class Map:
         for pt in points:
             self.highlighted[pt.numpy_index] = True
 
+        self.__composited_tiles_need_update = True
+
     def find_walkable_path_from_point_to_point(self, point_a: Point, point_b: Point) -> Iterable[Point]:
         '''
         Find a path between point A and point B using tcod's A* implementation.
         '''
-        a_star = tcod.path.AStar(self.tiles['walkable'])
+        a_star = tcod.path.AStar(self.walkable)
         path = a_star.get_path(point_a.x, point_a.y, point_b.x, point_b.y)
         return map(lambda t: Point(t[0], t[1]), path)
 
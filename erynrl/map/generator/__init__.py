@@ -28,7 +28,7 @@ class MapGenerator:
         raise NotImplementedError()
 
     def generate(self, map: 'Map'):
-        '''Generate a map and place it in `tiles`'''
+        '''Generate a map and place it in the map's `tile_codes`'''
         raise NotImplementedError()
 
 
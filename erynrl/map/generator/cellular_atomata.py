@@ -7,8 +7,9 @@ from typing import Optional, TYPE_CHECKING
 import numpy as np
 
 from ... import log
-from ...geometry import Point, Rect, Vector
-from ..tile import Empty, Floor, Wall, tile_datatype
+from ...geometry import Rect
+from ..grid import count_neighbors
+from ..tile import Empty, Floor, TileCode
 
 if TYPE_CHECKING:
     from .. import Map
@@ -49,7 +50,17 @@ class CellularAtomataMapGenerator:
         '''
         self.bounds = bounds
         self.configuration = config if config else CellularAtomataMapGenerator.Configuration()
-        self.tiles = np.full((bounds.size.height, bounds.size.width), fill_value=Empty, dtype=tile_datatype, order='C')
+
+        self.cells = np.full((bounds.size.height, bounds.size.width), fill_value=False, order='C')
+        '''
+        The state of the atomaton: a grid of bools, True where a cell is alive (i.e. a Floor). The atomaton only has two
+        states, so it's kept as one byte per cell instead of full tiles.
+        '''
+
+    @property
+    def tiles(self) -> np.ndarray:
+        '''The state of the atomaton as an array of tiles: Floor for live cells and Empty for dead ones.'''
+        return np.where(self.cells, Floor, Empty)
 
     def generate(self):
         '''
@@ -63,22 +74,22 @@ class CellularAtomataMapGenerator:
         self._run_atomaton()
 
     def apply(self, map: 'Map'):
-        origin = self.bounds.origin
-        for y, x in np.ndindex(self.tiles.shape):
-            map_pt = origin + Vector(x, y)
-            tile = self.tiles[y, x]
-            if tile == Floor:
-                map.tiles[map_pt.numpy_index] = tile
+        # Cells are indexed (y, x) and map tiles are indexed (x, y), so transpose the cells and use them as a mask over
+        # the part of the map covered by the atomaton.
+        bounds = self.bounds
+        map.tile_codes[bounds.min_x:bounds.end_x, bounds.min_y:bounds.end_y][self.cells.T] = TileCode.Floor
 
     def _fill(self):
         fill_percentage = self.configuration.fill_percentage
 
-        for y, x in np.ndindex(self.tiles.shape):
-            self.tiles[y, x] = Floor if random.random() < fill_percentage else Empty
+        # Draw one random number per cell, in row-major order, and seed the whole grid with a single comparison rather
+        # than writing cells one at a time.
+        shape = self.cells.shape
+        samples = np.fromiter((random.random() for _ in range(shape[0] * shape[1])), dtype=np.float64)
+        self.cells = (samples < fill_percentage).reshape(shape)
 
     def _run_atomaton(self):
-        alternate_tiles = np.full((self.bounds.size.height, self.bounds.size.width),
-                                  fill_value=Empty, dtype=tile_datatype, order='C')
+        alternate_cells = np.full((self.bounds.size.height, self.bounds.size.width), fill_value=False, order='C')
 
         number_of_rounds = self.configuration.number_of_rounds
         if number_of_rounds < 1:
@@ -92,42 +103,25 @@ class CellularAtomataMapGenerator:
 
         for i in range(number_of_rounds):
             if i % 2 == 0:
-                from_tiles = self.tiles
-                to_tiles = alternate_tiles
+                from_cells = self.cells
+                to_cells = alternate_cells
             else:
-                from_tiles = alternate_tiles
-                to_tiles = self.tiles
+                from_cells = alternate_cells
+                to_cells = self.cells
 
-            self._do_round(from_tiles, to_tiles)
+            self._do_round(from_cells, to_cells)
 
-        # If we ended on a round where alternate_tiles was the "to" tile grid
-        # above, save it back to self.tiles.
+        # If we ended on a round where alternate_cells was the "to" grid
+        # above, save it back to self.cells.
         if number_of_rounds % 2 == 0:
-            self.tiles = alternate_tiles
-
-    def _do_round(self, from_tiles: np.ndarray, to_tiles: np.ndarray):
-        for y, x in np.ndindex(from_tiles.shape):
-            pt = Point(x, y)
-
-            # Start with 1 because the point is its own neighbor
-            number_of_neighbors = 1
-            for neighbor in pt.neighbors:
-                try:
-                    if from_tiles[neighbor.y, neighbor.x] == Floor:
-                        number_of_neighbors += 1
-                except IndexError:
-                    pass
-
-            idx = (pt.y, pt.x)
-            tile_is_alive = from_tiles[idx] == Floor
-            if tile_is_alive and number_of_neighbors >= 5:
-                # Survival
-                to_tiles[idx] = Floor
-            elif not tile_is_alive and number_of_neighbors >= 5:
-                # Birth
-                to_tiles[idx] = Floor
-            else:
-                to_tiles[idx] = Empty
+            self.cells = alternate_cells
+
+    def _do_round(self, from_cells: np.ndarray, to_cells: np.ndarray):
+        # A cell counts as its own neighbor, so with the eight around it, a cell has 5 or more neighbors when at least
+        # 4 of the cells around it are alive. Then it survives if it's alive, or is born if it's dead. Otherwise, it
+        # dies. Cells beyond the edges of the grid are dead.
+        number_of_neighbors = count_neighbors(from_cells) + 1
+        np.greater_equal(number_of_neighbors, 5, out=to_cells)
 
     def __str__(self):
         return '\n'.join(''.join(chr(i['light']['ch']) for i in row) for row in self.tiles)
@@ -8,12 +8,14 @@ import random
 from itertools import pairwise
 from typing import List, TYPE_CHECKING
 
+import numpy as np
 import tcod
 
 from ... import log
 from ...geometry import Point
+from ..grid import neighbors_of
 from ..room import Corridor, Room
-from ..tile import Empty, Floor, Wall
+from ..tile import TileCode
 
 if TYPE_CHECKING:
     from .. import Map
@@ -63,61 +65,66 @@ class ElbowCorridorGenerator(CorridorGenerator):
 
         sorted_rooms = self._sorted_rooms(rooms)
 
-        for left_room, right_room in pairwise(sorted_rooms):
-            corridor = self._generate_corridor_between(left_room, right_room)
+        # Each corridor randomly goes horizontally or vertically first. Draw one random bit for every corridor all at
+        # once instead of one random float per corridor.
+        orientation_bits = random.getrandbits(len(sorted_rooms) - 1)
+
+        for i, (left_room, right_room) in enumerate(pairwise(sorted_rooms)):
+            horizontal_first = bool(orientation_bits >> i & 1)
+            corridor = self._generate_corridor_between(left_room, right_room, horizontal_first)
             self.corridors.append(corridor)
 
         return True
 
-    def _generate_corridor_between(self, left_room, right_room) -> Corridor:
-        left_room_bounds = left_room.bounds
-        right_room_bounds = right_room.bounds
+    def _generate_corridor_between(self, left_room: Room, right_room: Room, horizontal_first: bool) -> Corridor:
+        # This runs once per pair of rooms. Check the log level once, and skip building the log arguments entirely when
+        # debug logging is off.
+        should_log = log.MAP.isEnabledFor(log.DEBUG)
 
-        log.MAP.debug(' left: %s, %s', left_room, left_room_bounds)
-        log.MAP.debug('right: %s, %s', right_room, right_room_bounds)
+        if should_log:
+            log.MAP.debug(' left: %s, %s', left_room, left_room.bounds)
+            log.MAP.debug('right: %s, %s', right_room, right_room.bounds)
 
-        start_point = left_room_bounds.midpoint
-        end_point = right_room_bounds.midpoint
+        start_point = left_room.center
+        end_point = right_room.center
 
-        # Randomly choose whether to move horizontally then vertically or vice versa
-        horizontal_first = random.random() < 0.5
         if horizontal_first:
             corner = Point(end_point.x, start_point.y)
         else:
             corner = Point(start_point.x, end_point.y)
 
-        log.MAP.debug(
-            'Digging a tunnel between %s and %s with corner %s (%s)',
-            start_point,
-            end_point,
-            corner,
-            'horizontal' if horizontal_first else 'vertical')
-        log.MAP.debug('|-> start: %s', left_room_bounds)
-        log.MAP.debug('`->   end: %s', right_room_bounds)
-
-        corridor: List[Point] = []
-
-        for x, y in tcod.los.bresenham(tuple(start_point), tuple(corner)).tolist():
-            corridor.append(Point(x, y))
+        if should_log:
+            log.MAP.debug(
+                'Digging a tunnel between %s and %s with corner %s (%s)',
+                start_point,
+                end_point,
+                corner,
+                'horizontal' if horizontal_first else 'vertical')
+            log.MAP.debug('|-> start: %s', left_room.bounds)
+            log.MAP.debug('`->   end: %s', right_room.bounds)
 
-        for x, y in tcod.los.bresenham(tuple(corner), tuple(end_point)).tolist():
-            corridor.append(Point(x, y))
+        # Keep the line segments as the arrays tcod returns so they can be used to index into the map's tiles directly.
+        # Both segments include the corner, so drop it from the second one.
+        coordinates = np.concatenate((
+            tcod.los.bresenham(tuple(start_point), tuple(corner)),
+            tcod.los.bresenham(tuple(corner), tuple(end_point))[1:]))
 
-        return Corridor(points=corridor)
+        return Corridor(coordinates)
 
     def apply(self, map: 'Map'):
-        tiles = map.tiles
+        tile_codes = map.tile_codes
 
         map.corridors = self.corridors
 
+        is_corridor = np.full(tile_codes.shape, fill_value=False, order='F')
         for corridor in self.corridors:
-            for pt in corridor:
-                tiles[pt.x, pt.y] = Floor
-                for neighbor in pt.neighbors:
-                    if not (0 <= neighbor.x < tiles.shape[0] and 0 <= neighbor.y < tiles.shape[1]):
-                        continue
-                    if tiles[neighbor.x, neighbor.y] == Empty:
-                        tiles[neighbor.x, neighbor.y] = Wall
+            coordinates = corridor.coordinates
+            is_corridor[coordinates[:, 0], coordinates[:, 1]] = True
+
+        tile_codes[is_corridor] = TileCode.Floor
+
+        # Wall in the corridors: every empty tile next to a corridor gets a wall.
+        tile_codes[neighbors_of(is_corridor) & (tile_codes == TileCode.Empty)] = TileCode.Wall
 
 
 class NetHackCorridorGenerator(CorridorGenerator):
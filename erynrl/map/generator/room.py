@@ -3,15 +3,16 @@
 import math
 import random
 from dataclasses import dataclass
-from typing import Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 
 import numpy as np
 import tcod
 
 from ... import log
 from ...geometry import Point, Rect, Size
+from ..grid import neighbors_of
 from ..room import FreeformRoom, RectangularRoom, Room
-from ..tile import Empty, Floor, StairsDown, StairsUp, Wall, tile_datatype
+from ..tile import TileCode
 from .cellular_atomata import CellularAtomataMapGenerator
 
 if TYPE_CHECKING:
@@ -66,29 +67,27 @@ class RoomGenerator:
 
     def _apply(self, map: 'Map'):
         '''
-        Apply the generated list of rooms to an array of tiles. Subclasses must implement this.
+        Apply the generated list of rooms to the map's tile codes. Subclasses must implement this.
 
         Arguments
         ---------
         map: Map
             The game map to apply the generated room to
         '''
-        tiles = map.tiles
+        tile_codes = map.tile_codes
 
         map.rooms = self.rooms
 
+        # Mark the floors of all the rooms in one mask, and write them into the map in one pass.
+        is_floor = np.full(tile_codes.shape, fill_value=False, order='F')
         for room in self.rooms:
-            for pt in room.floor_points:
-                tiles[pt.numpy_index] = Floor
+            room.fill_floor(is_floor, True)
 
-        for room in self.rooms:
-            for pt in room.wall_points:
-                idx = pt.numpy_index
-
-                if tiles[idx] != Empty:
-                    continue
+        np.putmask(tile_codes, is_floor, TileCode.Floor)
 
-                tiles[idx] = Wall
+        # Every room is surrounded by walls, so rather than drawing each room's walls, put a wall on every empty tile
+        # next to a floor tile in one pass over the whole map.
+        tile_codes[neighbors_of(is_floor) & (tile_codes == TileCode.Empty)] = TileCode.Wall
 
     def _generate_stairs(self):
         up_stair_room = random.choice(self.rooms)
@@ -99,19 +98,25 @@ class RoomGenerator:
         else:
             down_stair_room = up_stair_room
 
-        self.up_stairs.append(random.choice(list(up_stair_room.walkable_tiles)))
-        self.down_stairs.append(random.choice(list(down_stair_room.walkable_tiles)))
+        self.up_stairs.append(self.__random_walkable_point_in_room(up_stair_room))
+        self.down_stairs.append(self.__random_walkable_point_in_room(down_stair_room))
+
+    @staticmethod
+    def __random_walkable_point_in_room(room: Room) -> Point:
+        coordinates = room.walkable_coordinates
+        x, y = coordinates[random.randrange(len(coordinates))]
+        return Point(int(x), int(y))
 
     def _apply_stairs(self, map: 'Map'):
-        tiles = map.tiles
+        tile_codes = map.tile_codes
 
         map.up_stairs = self.up_stairs
         map.down_stairs = self.down_stairs
 
         for pt in self.up_stairs:
-            tiles[pt.numpy_index] = StairsUp
+            tile_codes[pt.numpy_index] = TileCode.StairsUp
         for pt in self.down_stairs:
-            tiles[pt.numpy_index] = StairsDown
+            tile_codes[pt.numpy_index] = TileCode.StairsDown
 
 
 class RectMethod:
@@ -240,7 +245,12 @@ class BSPRectMethod(RectMethod):
         self.configuration = config or self.__class__.Configuration()
 
     def generate(self, map: 'Map') -> Iterator[Rect]:
-        nodes_with_rooms = set()
+        number_of_rooms_generated = 0
+
+        # The ids of nodes that have a room, or that are inside a node with a room. Level order visits every parent
+        # before its children, so a node is claimed exactly when its parent is, and checking one id replaces walking
+        # all the way up the tree.
+        claimed_node_ids: Set[int] = set()
 
         minimum_room_size = self.configuration.minimum_room_size
         maximum_room_size = self.configuration.maximum_room_size
@@ -250,13 +260,20 @@ class BSPRectMethod(RectMethod):
         # Recursively divide the map into squares of various sizes to place rooms in.
         bsp = tcod.bsp.BSP(x=0, y=0, width=map_size.width, height=map_size.height)
 
+        # tcod's BSP uses its own random number generator. Seed it from the game configuration so the splits are
+        # reproducible. split_recursive hands its seed argument straight to libtcod, so it needs the underlying C
+        # object rather than the Python wrapper.
+        seed = map.configuration.seed
+        bsp_rng = tcod.random.Random(seed=seed) if seed is not None else None
+
         # Add 2 to the minimum width and height to account for walls
         bsp.split_recursive(
             depth=6,
             min_width=minimum_room_size.width,
             min_height=minimum_room_size.height,
             max_horizontal_ratio=self.configuration.room_size_ratio[0],
-            max_vertical_ratio=self.configuration.room_size_ratio[1])
+            max_vertical_ratio=self.configuration.room_size_ratio[1],
+            seed=bsp_rng.random_c if bsp_rng else None)
 
         log.MAP_BSP.info('Generating room rects via BSP')
 
@@ -270,15 +287,16 @@ class BSPRectMethod(RectMethod):
                                   node_width, node_height, maximum_room_size)
                 continue
 
-            if len(nodes_with_rooms) >= self.configuration.number_of_rooms:
+            if number_of_rooms_generated >= self.configuration.number_of_rooms:
                 # Made as many rooms as we're allowed. We're done.
                 log.MAP_BSP.debug("Generated enough rooms (more than %d); we're done",
                                   self.configuration.number_of_rooms)
                 return
 
-            if any(node in nodes_with_rooms for node in self.__all_parents_of_node(bsp_node)):
+            if bsp_node.parent is not None and id(bsp_node.parent) in claimed_node_ids:
                 # Already made a room for one of this node's parents
-                log.MAP_BSP.debug('Already made a room for parent of %s', bsp_node)
+                self.__log_node(log.DEBUG, 'Already made a room for parent of %s', bsp_node)
+                claimed_node_ids.add(id(bsp_node))
                 continue
 
             try:
@@ -288,23 +306,25 @@ class BSPRectMethod(RectMethod):
             except ZeroDivisionError:
                 probability_of_room = 1.0
 
-            log.MAP_BSP.info('Probability of generating room for %s: %f', bsp_node, probability_of_room)
+            self.__log_node(log.INFO, 'Probability of generating room for %s: %f', bsp_node, probability_of_room)
 
             if random.random() <= probability_of_room:
-                log.MAP_BSP.info('Yielding room for node %s', bsp_node)
-                nodes_with_rooms.add(bsp_node)
+                self.__log_node(log.INFO, 'Yielding room for node %s', bsp_node)
+                number_of_rooms_generated += 1
+                claimed_node_ids.add(id(bsp_node))
                 yield self.__rect_from_bsp_node(bsp_node)
 
-        log.MAP_BSP.info('Finished BSP room rect generation, yielded %d rooms', len(nodes_with_rooms))
+        log.MAP_BSP.info('Finished BSP room rect generation, yielded %d rooms', number_of_rooms_generated)
+
+    @staticmethod
+    def __log_node(level: int, message: str, bsp_node: tcod.bsp.BSP, *args):
+        # Formatting a BSP node is slow, so log its bounds as a plain tuple, and only when the message will be logged.
+        if log.MAP_BSP.isEnabledFor(level):
+            log.MAP_BSP.log(level, message, (bsp_node.x, bsp_node.y, bsp_node.w, bsp_node.h), *args)
 
     def __rect_from_bsp_node(self, bsp_node: tcod.bsp.BSP) -> Rect:
         return Rect.from_raw_values(bsp_node.x, bsp_node.y, bsp_node.w, bsp_node.h)
 
-    def __all_parents_of_node(self, node: tcod.bsp.BSP | None) -> Iterable[tcod.bsp.BSP]:
-        while node:
-            yield node
-            node = node.parent
-
 
 class RoomMethod:
     '''An abstract class defining a method for generating rooms.'''
@@ -333,29 +353,20 @@ class CellularAtomatonRoomMethod(RoomMethod):
         room_generator = CellularAtomataMapGenerator(atomaton_rect, self.cellular_atomaton_configuration)
         room_generator.generate()
 
-        # Create a new tile array and copy the result of the atomaton into it,
-        # then draw walls everywhere that neighbors a floor tile.
+        # Copy the live cells of the atomaton into a floor mask the size of the
+        # whole room, then make tile codes from it, with walls everywhere that
+        # neighbors a floor tile.
 
         width = rect.width
         height = rect.height
 
-        room_tiles = np.full((height, width), fill_value=Empty, dtype=tile_datatype, order='C')
-        room_tiles[1:height - 1, 1:width - 1] = room_generator.tiles
+        is_floor = np.full((height, width), fill_value=False, order='C')
+        is_floor[1:height - 1, 1:width - 1] = room_generator.cells
 
-        for y, x in np.ndindex(room_tiles.shape):
-            if room_tiles[y, x] == Floor:
-                continue
-
-            for neighbor in Point(x, y).neighbors:
-                try:
-                    if room_tiles[neighbor.y, neighbor.x] != Floor:
-                        continue
-                    room_tiles[y, x] = Wall
-                    break
-                except IndexError:
-                    pass
+        room_tile_codes = np.where(is_floor, np.uint8(TileCode.Floor), np.uint8(TileCode.Empty))
+        room_tile_codes[neighbors_of(is_floor) & ~is_floor] = TileCode.Wall
 
-        return FreeformRoom(rect, room_tiles)
+        return FreeformRoom(rect, room_tile_codes)
 
 
 class OrRoomMethod(RoomMethod):
@@ -6,10 +6,37 @@ Utilities for maps.
 
 import numpy as np
 
-from .tile import Empty
-from ..geometry import Size
+from ..geometry import Direction
 
 
-def make_grid(size: Size, fill: np.ndarray = Empty) -> np.ndarray:
-    '''Make a numpy array of the given size filled with `fill` tiles.'''
-    return np.full(size.numpy_shape, fill_value=fill, order='F')
+def neighbors_of(mask: np.ndarray) -> np.ndarray:
+    '''
+    Return a boolean array, the same shape as `mask`, that is True for every cell that has a True cell among its eight
+    neighbors. This is an eight-way dilation of `mask`, done with one shifted slice per direction instead of a loop over
+    every cell.
+
+    Cells outside the grid are treated as False; the grid does not wrap around at its edges.
+    '''
+    padded = np.pad(mask, 1, mode='constant', constant_values=False)
+    width, height = mask.shape
+
+    result = np.zeros_like(mask, dtype=np.bool_)
+    for dx, dy in Direction.OFFSETS:
+        result |= padded[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+
+    return result
+
+
+def count_neighbors(mask: np.ndarray) -> np.ndarray:
+    '''
+    Return an array of uint8, the same shape as `mask`, with the number of True cells among the eight neighbors of every
+    cell. Like `neighbors_of`, cells outside the grid count as False.
+    '''
+    padded = np.pad(mask, 1, mode='constant', constant_values=False)
+    width, height = mask.shape
+
+    result = np.zeros(mask.shape, dtype=np.uint8)
+    for dx, dy in Direction.OFFSETS:
+        result += padded[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+
+    return result
@@ -4,12 +4,13 @@
 Implements an abstract Room class, and subclasses that implement it. Rooms are basic components of maps.
 '''
 
+from functools import cached_property
 from typing import Iterable, Iterator, List, Optional
 
 import numpy as np
 
 from ..geometry import Point, Rect, Vector
-from .tile import Floor, Wall
+from .tile import WALKABLE_BY_CODE, TileCode, tiles_from_codes
 
 
 class Room:
@@ -18,16 +19,22 @@ class Room:
     def __init__(self, bounds: Rect):
         self.bounds: Rect = bounds
 
-    @property
-    def center(self) -> Point:
+        self.center: Point = bounds.midpoint
         '''The center of the room, truncated according to integer math rules'''
-        return self.bounds.midpoint
 
     @property
     def wall_points(self) -> Iterable[Point]:
         '''An iterator over all the points that make up the walls of this room.'''
         raise NotImplementedError()
 
+    @property
+    def wall_coordinates(self) -> np.ndarray:
+        '''
+        An Nx2 array of the (x, y) coordinates of every point in the walls of this room, in the same order as
+        `wall_points`. It can be used directly as an index into a map-sized array.
+        '''
+        raise NotImplementedError()
+
     @property
     def floor_points(self) -> Iterable[Point]:
         '''An iterator over all the points that make of the floor of this room'''
@@ -38,6 +45,23 @@ class Room:
         '''An iterator over all the points that are walkable in this room.'''
         raise NotImplementedError()
 
+    @property
+    def walkable_coordinates(self) -> np.ndarray:
+        '''
+        An Nx2 array of the (x, y) coordinates of every walkable point in this room, in the same order as
+        `walkable_tiles`. Use this instead of `walkable_tiles` when you don't need a Point for every tile, e.g. to pick
+        one at random.
+        '''
+        raise NotImplementedError()
+
+    def fill_floor(self, array: np.ndarray, value):
+        '''
+        Set every point of the floor of this room to `value` in a map-sized array indexed by (x, y), e.g. a map's tile
+        array. Subclasses should override this with something faster than setting one point at a time.
+        '''
+        for pt in self.floor_points:
+            array[pt.numpy_index] = value
+
 
 class RectangularRoom(Room):
     '''A rectangular room defined by a Rect.
@@ -56,8 +80,19 @@ class RectangularRoom(Room):
             for x in range(floor_rect.min_x, floor_rect.max_x + 1):
                 yield Point(x, y)
 
+    @cached_property
+    def walkable_coordinates(self) -> np.ndarray:
+        floor_rect = self.bounds.inset_rect(top=1, right=1, bottom=1, left=1)
+        ys, xs = np.mgrid[floor_rect.min_y:floor_rect.max_y + 1, floor_rect.min_x:floor_rect.max_x + 1]
+        return np.stack((xs.ravel(), ys.ravel()), axis=-1)
+
     @property
     def wall_points(self) -> Iterable[Point]:
+        for x, y in self.wall_coordinates.tolist():
+            yield Point(x, y)
+
+    @cached_property
+    def wall_coordinates(self) -> np.ndarray:
         bounds = self.bounds
 
         min_y = bounds.min_y
@@ -65,13 +100,15 @@ class RectangularRoom(Room):
         min_x = bounds.min_x
         max_x = bounds.max_x
 
-        for x in range(min_x, max_x + 1):
-            yield Point(x, min_y)
-            yield Point(x, max_y)
+        # The top and bottom walls, one column at a time, then the left and right walls between them, one row at a time.
+        columns = np.arange(min_x, max_x + 1, dtype=np.int32)
+        rows = np.arange(min_y + 1, max_y, dtype=np.int32)
+        xs = np.concatenate((np.repeat(columns, 2), np.tile(np.array((min_x, max_x), dtype=np.int32), len(rows))))
+        ys = np.concatenate((np.tile(np.array((min_y, max_y), dtype=np.int32), len(columns)), np.repeat(rows, 2)))
 
-        for y in range(min_y + 1, max_y):
-            yield Point(min_x, y)
-            yield Point(max_x, y)
+        coordinates = np.stack((xs, ys), axis=-1)
+        coordinates.setflags(write=False)
+        return coordinates
 
     @property
     def floor_points(self) -> Iterable[Point]:
@@ -86,53 +123,100 @@ class RectangularRoom(Room):
             for y in range(min_y, max_y + 1):
                 yield Point(x, y)
 
+    def fill_floor(self, array: np.ndarray, value):
+        # The floor is the bounds inset by one tile on every side, so fill it with one slice.
+        bounds = self.bounds
+        array[bounds.min_x + 1:bounds.max_x, bounds.min_y + 1:bounds.max_y] = value
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.bounds})'
 
 
 class FreeformRoom(Room):
-    def __init__(self, bounds: Rect, tiles: np.ndarray):
+    '''A room of any shape, defined by a grid of tiles.
+
+    Attributes
+    ----------
+    bounds : Rect
+        A rectangle that defines the extent of the room, including its walls
+    tile_codes : np.ndarray
+        An array of `TileCode`s, indexed (y, x), with the shape of the room
+    '''
+
+    def __init__(self, bounds: Rect, tile_codes: np.ndarray):
         super().__init__(bounds)
-        self.tiles = tiles
+        self.tile_codes = tile_codes
 
     @property
     def floor_points(self) -> Iterable[Point]:
-        room_origin_vector = Vector.from_point(self.bounds.origin)
-        for y, x in np.ndindex(self.tiles.shape):
-            if self.tiles[y, x] == Floor:
-                yield Point(x, y) + room_origin_vector
+        return self.__points_where(self.tile_codes == TileCode.Floor)
 
     @property
     def wall_points(self) -> Iterable[Point]:
-        room_origin_vector = Vector.from_point(self.bounds.origin)
-        for y, x in np.ndindex(self.tiles.shape):
-            if self.tiles[y, x] == Wall:
-                yield Point(x, y) + room_origin_vector
+        return self.__points_where(self.tile_codes == TileCode.Wall)
+
+    @cached_property
+    def wall_coordinates(self) -> np.ndarray:
+        return self.__coordinates_where(self.tile_codes == TileCode.Wall)
 
     @property
     def walkable_tiles(self) -> Iterable[Point]:
+        return self.__points_where(self.__is_walkable)
+
+    @cached_property
+    def walkable_coordinates(self) -> np.ndarray:
+        return self.__coordinates_where(self.__is_walkable)
+
+    def fill_floor(self, array: np.ndarray, value):
+        # Room tiles are indexed (y, x), so transpose the floor mask to match the map.
+        bounds = self.bounds
+        is_floor = (self.tile_codes == TileCode.Floor).T
+        array[bounds.min_x:bounds.end_x, bounds.min_y:bounds.end_y][is_floor] = value
+
+    @property
+    def __is_walkable(self) -> np.ndarray:
+        return WALKABLE_BY_CODE[self.tile_codes]
+
+    def __coordinates_where(self, mask: np.ndarray) -> np.ndarray:
+        # np.nonzero returns indexes in row-major order, the same order __points_where yields them in.
+        ys, xs = np.nonzero(mask)
+        origin = self.bounds.origin
+        return np.stack((xs + origin.x, ys + origin.y), axis=-1)
+
+    def __points_where(self, mask: np.ndarray) -> Iterator[Point]:
         room_origin_vector = Vector.from_point(self.bounds.origin)
-        for y, x in np.ndindex(self.tiles.shape):
-            if self.tiles[y, x]['walkable']:
-                yield Point(x, y) + room_origin_vector
+        for y, x in zip(*np.nonzero(mask)):
+            yield Point(int(x), int(y)) + room_origin_vector
 
     def __str__(self):
-        return '\n'.join(''.join(chr(i['light']['ch']) for i in row) for row in self.tiles)
+        characters = tiles_from_codes(self.tile_codes)['light']['ch']
+        return '\n'.join(''.join(chr(ch) for ch in row) for row in characters)
 
 
 class Corridor:
     '''
     A corridor is a list of points connecting two endpoints
+
+    ### Attributes
+
+    `coordinates`: np.ndarray
+        An Nx2 array of the (x, y) coordinates of the points in the corridor, in order from one end to the other. This
+        can be used directly as an index into a map's tile array.
     '''
 
-    def __init__(self, points: Optional[List[Point]] = None):
-        self.points: List[Point] = points or []
+    def __init__(self, coordinates: Optional[np.ndarray] = None):
+        self.coordinates: np.ndarray = coordinates if coordinates is not None else np.empty((0, 2), dtype=np.int32)
+
+    @property
+    def points(self) -> List[Point]:
+        '''The points in this corridor'''
+        return list(self)
 
     @property
     def length(self) -> int:
         '''The length of this corridor'''
-        return len(self.points)
+        return len(self.coordinates)
 
     def __iter__(self) -> Iterator[Point]:
-        for pt in self.points:
-            yield pt
+        for x, y in self.coordinates.tolist():
+            yield Point(x, y)
@@ -5,8 +5,14 @@ Map tiles and tile related things.
 
 Maps are represented with 2-dimensional numpy arrays with the `dtype`s defined
 here. Tiles are instances of those dtypes.
+
+While a map is being generated, it's represented by an array of `TileCode`s
+instead: one byte per tile, which is much faster to compare and fill than the
+tile structs. `tiles_from_codes` converts the codes into tiles once the map is
+done.
 '''
 
+from enum import IntEnum
 from typing import Tuple
 
 import numpy as np
@@ -14,9 +20,9 @@ import numpy as np
 graphic_datatype = np.dtype([
     # Character, a Unicode codepoint represented as an int32
     ('ch', np.int32),
-    # Foreground color, three bytes
+    # Foreground color, four bytes: RGBA
     ('fg', '4B'),
-    # Background color, three bytes
+    # Background color, four bytes: RGBA
     ('bg', '4B'),
 ])
 
@@ -71,3 +77,41 @@ Wall = tile(
     dark=(ord('#'), (80, 80, 80, 255), (0, 0, 0, 255)),
     light=(ord('#'), (100, 100, 100, 255), (20, 20, 20, 255)),
     highlighted=(ord('#'), (100, 100, 100, 255), (20, 20, 20, 255)))
+
+
+class TileCode(IntEnum):
+    '''
+    One-byte codes for each kind of map tile. Use these with a uint8 array while generating a map, and convert them to
+    tiles with `tiles_from_codes`.
+    '''
+
+    Empty = 0
+    Wall = 1
+    Floor = 2
+    StairsUp = 3
+    StairsDown = 4
+
+
+# The tile for each TileCode, indexed by code
+_TILES_BY_CODE = np.stack([Empty, Wall, Floor, StairsUp, StairsDown])
+
+# Whether each TileCode is walkable and transparent, indexed by code. Use these to look up one flag for a whole array of
+# codes without building the tile structs.
+WALKABLE_BY_CODE = np.ascontiguousarray(_TILES_BY_CODE['walkable'])
+WALKABLE_BY_CODE.setflags(write=False)
+TRANSPARENT_BY_CODE = np.ascontiguousarray(_TILES_BY_CODE['transparent'])
+TRANSPARENT_BY_CODE.setflags(write=False)
+
+# The graphic for each TileCode in each of the ways a map tile can be drawn, indexed by [state, code]. The states are,
+# in order: shrouded, dark (explored), light (visible), and highlighted.
+GRAPHICS_BY_STATE_AND_CODE = np.stack([
+    np.broadcast_to(Shroud, _TILES_BY_CODE.shape),
+    _TILES_BY_CODE['dark'],
+    _TILES_BY_CODE['light'],
+    _TILES_BY_CODE['highlighted']])
+GRAPHICS_BY_STATE_AND_CODE.setflags(write=False)
+
+
+def tiles_from_codes(codes: np.ndarray) -> np.ndarray:
+    '''Convert an array of TileCodes into a Fortran-ordered array of tiles of the same shape.'''
+    return np.asfortranarray(_TILES_BY_CODE[codes])
@@ -9,7 +9,7 @@ from typing import Optional, Tuple
 # pylint: disable=too-many-instance-attributes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Species:
     '''A kind of monster.
 
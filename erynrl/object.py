@@ -2,7 +2,8 @@
 
 '''Defines a number of high-level game objects. The parent class of all game objects is the Entity class.'''
 
-from typing import TYPE_CHECKING, Optional, Type
+from reprlib import recursive_repr
+from typing import TYPE_CHECKING, Dict, Optional, Type
 
 import tcod
 
@@ -30,6 +31,10 @@ class Entity:
         position
     '''
 
+    # Entities are created by the dozen for every level and their attributes are read on every turn and every frame, so
+    # they declare their attributes up front instead of carrying an instance dict. Subclasses declare their own.
+    __slots__ = ('identifier', 'position', 'renderable', 'blocks_movement')
+
     # A monotonically increasing identifier to help differentiate between
     # entities that otherwise look identical
     __next_identifier = 1
@@ -51,6 +56,15 @@ class Entity:
         return f'{self.__class__.__name__}!{self.identifier}'
 
     def __repr__(self):
+        # Keep this short. Entities end up in logs and in containers of entities, and expanding all of their components
+        # every time adds up. Use full_repr() to see everything.
+        symbol = self.renderable.symbol if self.renderable else None
+        position = self.position
+        return f'{self.__class__.__name__}({symbol!r}@{position.x},{position.y})'
+
+    @recursive_repr()
+    def full_repr(self) -> str:
+        '''A verbose representation of this entity, including its components'''
         return f'{self.__class__.__name__}(position={self.position!r}, blocks_movement={self.blocks_movement}, renderable={self.renderable!r})'
 
 
@@ -67,8 +81,18 @@ class Actor(Entity):
     fighter : Fighter, optional
         If an entity can fight or take damage, an instance of the Fighter class.
         This is where hit points, attack power, defense power, etc live.
+    name : str
+        The name of this actor. This is a player-visible string.
+    sight_radius : int
+        The number of tiles this entity can see around itself
+    yields_corpse_on_death : bool
+        True if this Actor should produce a corpse when it dies
     '''
 
+    # These are read all the time, and never change once an actor is created, so they're plain attributes that
+    # subclasses set in their initializers rather than properties.
+    __slots__ = ('ai', 'fighter', 'name', 'sight_radius', 'yields_corpse_on_death')
+
     def __init__(
             self,
             *,
@@ -86,42 +110,33 @@ class Actor(Entity):
         self.ai = ai
         self.fighter = fighter
 
-    @property
-    def name(self) -> str:
-        '''The name of this actor. This is a player-visible string.'''
-        return 'Actor'
-
-    @property
-    def sight_radius(self) -> int:
-        '''The number of tiles this entity can see around itself'''
-        return 0
-
-    @property
-    def yields_corpse_on_death(self) -> bool:
-        '''True if this Actor should produce a corpse when it dies'''
-        return False
+        self.name = 'Actor'
+        self.sight_radius = 0
+        self.yields_corpse_on_death = False
 
-    def __repr__(self) -> str:
+    @recursive_repr()
+    def full_repr(self) -> str:
         return f'{self.__class__.__name__}(position={self.position!r}, fighter={self.fighter!r}, ai={self.ai!r}, renderable={self.renderable!r})'
 
 
 class Hero(Actor):
     '''The hero, the player character'''
 
+    __slots__ = ()
+
+    # The color the hero is drawn in. tcod's colors are Color objects, so convert it to a plain tuple once.
+    FOREGROUND_COLOR = tuple(tcod.white)
+
     def __init__(self, position: Point):
         super().__init__(
             position=position,
             fighter=Fighter(maximum_hit_points=30, attack_power=5, defense=2),
-            renderable=Renderable('@', Renderable.Order.HERO, tuple(tcod.white)))
+            renderable=Renderable('@', Renderable.Order.HERO, Hero.FOREGROUND_COLOR))
 
-    @property
-    def name(self) -> str:
-        return 'Hero'
+        self.name = 'Hero'
 
-    @property
-    def sight_radius(self) -> int:
         # TODO: Make this configurable
-        return 0
+        self.sight_radius = 0
 
     def __str__(self) -> str:
         assert self.fighter
@@ -131,6 +146,11 @@ class Hero(Actor):
 class Monster(Actor):
     '''An instance of a Species'''
 
+    __slots__ = ('species',)
+
+    # Renderables never change once they're made, so every monster of a species draws with the same one.
+    __renderables_by_species: Dict[Species, Renderable] = {}
+
     def __init__(self, species: Species, ai_class: Type['AI'], position: Optional[Point] = None):
         fighter = Fighter(
             maximum_hit_points=species.maximum_hit_points,
@@ -141,24 +161,24 @@ class Monster(Actor):
             ai=ai_class(self),
             position=position,
             fighter=fighter,
-            renderable=Renderable(
-                symbol=species.symbol,
-                fg=species.foreground_color,
-                bg=species.background_color))
+            renderable=Monster.__renderable_for_species(species))
 
         self.species = species
 
-    @property
-    def name(self) -> str:
-        return self.species.name
-
-    @property
-    def sight_radius(self) -> int:
-        return self.species.sight_radius
+        self.name = species.name
+        self.sight_radius = species.sight_radius
+        self.yields_corpse_on_death = True
 
-    @property
-    def yields_corpse_on_death(self) -> bool:
-        return True
+    @staticmethod
+    def __renderable_for_species(species: Species) -> Renderable:
+        renderable = Monster.__renderables_by_species.get(species)
+        if renderable is None:
+            renderable = Renderable(
+                symbol=species.symbol,
+                fg=species.foreground_color,
+                bg=species.background_color)
+            Monster.__renderables_by_species[species] = renderable
+        return renderable
 
     def __str__(self) -> str:
         assert self.fighter
@@ -168,6 +188,8 @@ class Monster(Actor):
 class Item(Entity):
     '''An instance of an Item'''
 
+    __slots__ = ('kind', 'name')
+
     def __init__(self, kind: items.Item, position: Optional[Point] = None, name: Optional[str] = None):
         super().__init__(position=position,
                          blocks_movement=False,
@@ -177,11 +199,6 @@ class Item(Entity):
                              fg=kind.foreground_color,
                              bg=kind.background_color))
         self.kind = kind
-        self._name = name
 
-    @property
-    def name(self) -> str:
+        self.name = name if name else kind.name
         '''The name of the item'''
-        if self._name:
-            return self._name
-        return self.kind.name
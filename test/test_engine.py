@@ -0,0 +1,93 @@
+# Eryn Wells <eryn@erynwells.me>
+
+from typing import List
+
+import numpy as np
+
+from erynrl import items, monsters
+from erynrl.ai import HostileEnemy
+from erynrl.configuration import Configuration
+from erynrl.engine import Engine
+from erynrl.geometry import Point, Size
+from erynrl.object import Item, Monster
+
+
+def _make_engine() -> Engine:
+    # The engine doesn't load fonts, so it doesn't need a font configuration.
+    config = Configuration(console_font_configuration=None, map_size=Size(80, 40), seed=1)
+    return Engine(config)
+
+
+def _empty_positions(engine: Engine, count: int) -> List[Point]:
+    '''Find `count` walkable positions with no entities on them'''
+    positions = []
+    for x, y in np.argwhere(engine.map.walkable).tolist():
+        point = Point(x, y)
+        if not engine.entities_at(point):
+            positions.append(point)
+            if len(positions) == count:
+                break
+    return positions
+
+
+def test_engine_add_move_and_remove_entity():
+    '''Check that the position indexes follow an entity as it's added, moved, and removed'''
+    engine = _make_engine()
+    positions = _empty_positions(engine, 2)
+    start = positions[0]
+    end = positions[1]
+
+    monster = Monster(monsters.Orc, ai_class=HostileEnemy, position=start)
+
+    engine.add_entity(monster)
+    assert list(engine.entities_at(start)) == [monster]
+    assert engine.blocking_entity_at(start) is monster
+    assert tuple(start) in engine.blocking_entity_positions
+
+    engine.move_entity(monster, end)
+    assert monster.position == end
+    assert not engine.entities_at(start)
+    assert engine.blocking_entity_at(start) is None
+    assert list(engine.entities_at(end)) == [monster]
+    assert engine.blocking_entity_at(end) is monster
+
+    engine.remove_entity(monster)
+    assert monster not in engine.entities
+    assert not engine.entities_at(end)
+    assert engine.blocking_entity_at(end) is None
+    assert tuple(end) not in engine.blocking_entity_positions
+
+
+def test_engine_entities_sharing_a_tile():
+    '''Check that two entities on the same tile are both indexed, and only the blocking one blocks'''
+    engine = _make_engine()
+    positions = _empty_positions(engine, 1)
+    position = positions[0]
+
+    item = Item(items.Corpse, position=position)
+    monster = Monster(monsters.Orc, ai_class=HostileEnemy, position=position)
+
+    engine.add_entity(item)
+    engine.add_entity(monster)
+    assert list(engine.entities_at(position)) == [item, monster]
+    assert engine.blocking_entity_at(position) is monster
+
+    engine.remove_entity(item)
+    assert list(engine.entities_at(position)) == [monster]
+    assert engine.blocking_entity_at(position) is monster
+
+
+def test_engine_dead_monster_stops_blocking():
+    '''Check that a blocking monster that dies is removed from the position indexes'''
+    engine = _make_engine()
+    positions = _empty_positions(engine, 1)
+    position = positions[0]
+
+    monster = Monster(monsters.Orc, ai_class=HostileEnemy, position=position)
+    engine.add_entity(monster)
+
+    engine.kill_actor(monster)
+    assert monster not in engine.entities
+    assert not engine.entities_at(position)
+    assert engine.blocking_entity_at(position) is None
+    assert tuple(position) not in engine.blocking_entity_positions
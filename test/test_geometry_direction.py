@@ -0,0 +1,10 @@
+# Eryn Wells <eryn@erynwells.me>
+
+from erynrl.geometry import Direction
+
+
+def test_direction_offsets_match_vectors():
+    '''Check that each row of Direction.OFFSETS matches the Vector for that direction'''
+    for index, direction in enumerate(Direction.all()):
+        assert tuple(Direction.OFFSETS[index]) == tuple(direction)
+        assert Direction.from_index(index) is direction
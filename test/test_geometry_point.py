@@ -1,6 +1,6 @@
 # Eryn Wells <eryn@erynwells.me>
 
-from erynrl.geometry import Point
+from erynrl.geometry import Direction, Point
 
 
 def test_point_neighbors():
@@ -50,3 +50,14 @@ def test_point_is_adjacent_to():
     assert not test_point.is_adjacent_to(Point(7, 5))
     assert not test_point.is_adjacent_to(Point(5, 3))
     assert not test_point.is_adjacent_to(Point(5, 7))
+
+
+def test_point_direction_to_adjacent_point():
+    '''Check that Point.direction_to_adjacent_point finds the direction of adjacent points, and only adjacent points'''
+    test_point = Point(5, 5)
+
+    for direction in Direction.all():
+        assert test_point.direction_to_adjacent_point(test_point + direction) == direction
+
+    assert test_point.direction_to_adjacent_point(test_point) is None
+    assert test_point.direction_to_adjacent_point(Point(7, 5)) is None
@@ -0,0 +1,40 @@
+# Eryn Wells <eryn@erynwells.me>
+
+import numpy as np
+
+from erynrl.configuration import Configuration
+from erynrl.geometry import Point, Rect, Size
+from erynrl.map import Map
+from erynrl.map.generator import MapGenerator
+from erynrl.map.room import RectangularRoom
+from erynrl.map.tile import TileCode
+
+
+class OneRoomGenerator(MapGenerator):
+    '''A map generator that makes one rectangular room with a floor from (1, 1) to (3, 2)'''
+
+    @property
+    def up_stairs(self):
+        return []
+
+    @property
+    def down_stairs(self):
+        return []
+
+    def generate(self, map: Map):
+        RectangularRoom(Rect(Point(0, 0), Size(5, 4))).fill_floor(map.tile_codes, TileCode.Floor)
+
+
+def test_map_points_are_walkable():
+    '''Check that Map.points_are_walkable agrees with point_is_walkable in bounds, and is False out of bounds'''
+    config = Configuration(console_font_configuration=None, map_size=Size(6, 5))
+    map = Map(config, OneRoomGenerator())
+
+    xs = np.array([1, 3, 0, 4, -1, 6, 2, 2, 100])
+    ys = np.array([1, 2, 0, 2, 1, 1, -1, 5, 100])
+
+    is_walkable = map.points_are_walkable(xs, ys)
+
+    assert is_walkable.tolist() == [True, True, False, False, False, False, False, False, False]
+    for x, y, walkable in zip(xs[:4].tolist(), ys[:4].tolist(), is_walkable[:4].tolist()):
+        assert map.point_is_walkable(Point(x, y)) == walkable
@@ -0,0 +1,44 @@
+# Eryn Wells <eryn@erynwells.me>
+
+import numpy as np
+
+from erynrl.map.grid import count_neighbors, neighbors_of
+
+
+def test_neighbors_of_single_cell():
+    '''Check that neighbors_of marks the eight cells around a single True cell, but not the cell itself'''
+    mask = np.full((5, 5), fill_value=False, order='F')
+    mask[2, 2] = True
+
+    neighbors = neighbors_of(mask)
+
+    expected_neighbors = np.full((5, 5), fill_value=False)
+    expected_neighbors[1:4, 1:4] = True
+    expected_neighbors[2, 2] = False
+
+    assert np.array_equal(neighbors, expected_neighbors)
+
+
+def test_neighbors_of_does_not_wrap():
+    '''Check that neighbors_of doesn't wrap around the edges of the grid'''
+    mask = np.full((5, 5), fill_value=False, order='F')
+    mask[0, 0] = True
+
+    neighbors = neighbors_of(mask)
+
+    assert neighbors[1, 1]
+    assert not neighbors[4, 4]
+    assert not neighbors[4, 0]
+    assert not neighbors[0, 4]
+
+
+def test_count_neighbors():
+    '''Check that count_neighbors counts True neighbors, excluding the cell itself and anything off the grid'''
+    mask = np.full((3, 3), fill_value=True, order='F')
+
+    counts = count_neighbors(mask)
+
+    assert counts[1, 1] == 8
+    assert counts[0, 0] == 3
+    assert counts[0, 1] == 5
+    assert counts.dtype == np.uint8
@@ -1,5 +1,7 @@
 # Eryn Wells <eryn@erynwells.me>
 
+import numpy as np
+
 from erynrl.geometry import Point, Rect, Size
 from erynrl.map.room import RectangularRoom
 
@@ -32,3 +34,45 @@ def test_rectangular_room_wall_points():
         expected_points.remove(pt)
 
     assert len(expected_points) == 0
+
+
+def test_rectangular_room_wall_coordinates():
+    '''Check that RectangularRoom.wall_coordinates has the points of the walls, in order, as a read-only array'''
+    room = RectangularRoom(Rect(Point(2, 3), Size(4, 3)))
+
+    expected_coordinates = [
+        (2, 3), (2, 5),
+        (3, 3), (3, 5),
+        (4, 3), (4, 5),
+        (5, 3), (5, 5),
+        (2, 4), (5, 4),
+    ]
+    coordinates = room.wall_coordinates
+
+    assert [tuple(xy) for xy in coordinates.tolist()] == expected_coordinates
+    assert not coordinates.flags.writeable
+
+
+def test_rectangular_room_fill_floor():
+    '''Check that RectangularRoom.fill_floor sets exactly the points in RectangularRoom.floor_points'''
+    rect = Rect(Point(2, 3), Size(6, 5))
+    room = RectangularRoom(rect)
+
+    expected_floor = np.full((12, 12), fill_value=False)
+    for pt in room.floor_points:
+        expected_floor[pt.numpy_index] = True
+
+    floor = np.full((12, 12), fill_value=False)
+    room.fill_floor(floor, True)
+
+    assert np.array_equal(floor, expected_floor)
+
+
+def test_rectangular_room_walkable_coordinates():
+    '''Check that RectangularRoom.walkable_coordinates has the same points, in the same order, as walkable_tiles'''
+    room = RectangularRoom(Rect(Point(2, 3), Size(5, 4)))
+
+    expected_coordinates = [tuple(pt) for pt in room.walkable_tiles]
+    coordinates = [tuple(xy) for xy in room.walkable_coordinates.tolist()]
+
+    assert coordinates == expected_coordinates
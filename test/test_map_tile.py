@@ -0,0 +1,33 @@
+# Eryn Wells <eryn@erynwells.me>
+
+import numpy as np
+
+from erynrl.map.tile import (TRANSPARENT_BY_CODE, WALKABLE_BY_CODE, Empty, Floor, StairsDown, StairsUp, TileCode, Wall,
+                             tiles_from_codes)
+
+
+def test_tiles_from_codes():
+    '''Check that tiles_from_codes converts every TileCode into the corresponding tile'''
+    codes = np.array([
+        [TileCode.Empty, TileCode.Wall, TileCode.Floor],
+        [TileCode.StairsUp, TileCode.StairsDown, TileCode.Floor],
+    ], dtype=np.uint8)
+
+    tiles = tiles_from_codes(codes)
+
+    assert tiles.shape == codes.shape
+    assert tiles.flags.f_contiguous
+    assert tiles[0, 0] == Empty
+    assert tiles[0, 1] == Wall
+    assert tiles[0, 2] == Floor
+    assert tiles[1, 0] == StairsUp
+    assert tiles[1, 1] == StairsDown
+
+
+def test_flags_by_code():
+    '''Check that the walkable and transparent lookup tables agree with the tiles for every TileCode'''
+    codes = np.array(list(TileCode), dtype=np.uint8)
+    tiles = tiles_from_codes(codes)
+
+    assert np.array_equal(WALKABLE_BY_CODE[codes], tiles['walkable'])
+    assert np.array_equal(TRANSPARENT_BY_CODE[codes], tiles['transparent'])